@@ -26,10 +26,15 @@ class AbseilConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "use_std_types": [None, True, False],
+        "hardened": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        # None: std::string_view, std::any, std::optional & std::variant are used if available with cppstd
+        "use_std_types": None,
+        "hardened": False,
     }
     short_paths = True
 
@@ -70,6 +75,9 @@ class AbseilConan(ConanFile):
                 f"{self.ref} requires C++{self._min_cppstd}, which your compiler does not support."
             )
 
+        if self.options.use_std_types:
+            check_min_cppstd(self, 17)
+
         if self.options.shared and is_msvc(self) and Version(self.version) < "20230802.1":
             # upstream tries its best to export symbols, but it's broken for the moment
             raise ConanInvalidConfiguration(f"{self.ref} shared not availabe for Visual Studio, please use version 20230802.1 or newer")
@@ -87,6 +95,10 @@ class AbseilConan(ConanFile):
         tc.variables["BUILD_TESTING"] = False
         # We force CMP0067 policy to NEW for our abi trick in _patch_sources()
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0067"] = "NEW"
+        if str(self.options.use_std_types) != "None":
+            # Bypass detection of std types in our abi trick, see abi_trick/conan_abi_test.cmake
+            for abi_variable in ["USE_STD_STRING_VIEW", "USE_STD_ANY", "USE_STD_OPTIONAL", "USE_STD_VARIANT"]:
+                tc.cache_variables[abi_variable] = bool(self.options.use_std_types)
         if is_msvc(self):
             # see https://github.com/abseil/abseil-cpp/issues/649
             tc.preprocessor_definitions["_HAS_DEPRECATED_RESULT_OF"] = 1
@@ -118,7 +130,10 @@ class AbseilConan(ConanFile):
         cmake = CMake(self)
         cmake.configure()
         abi_file = _ABIFile(self, os.path.join(self.build_folder, "abi.h"))
-        abi_file.replace_in_options_file(os.path.join(self.source_folder, "absl", "base", "options.h"))
+        options_h = os.path.join(self.source_folder, "absl", "base", "options.h")
+        abi_file.replace_in_options_file(options_h)
+        if self.options.hardened:
+            replace_in_file(self, options_h, "#define ABSL_OPTION_HARDENED 0", "#define ABSL_OPTION_HARDENED 1")
         cmake.build()
 
     def package(self):
@@ -1,11 +1,13 @@
 import os
 import re
 import textwrap
+import zipfile
 
 from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
 from conan.tools.apple import is_apple_os, fix_apple_shared_install_name
-from conan.tools.env import VirtualRunEnv
+from conan.tools.build import cross_building
+from conan.tools.env import Environment, VirtualRunEnv
 from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, load, mkdir, replace_in_file, rm, rmdir, save, unzip
 from conan.tools.gnu import Autotools, AutotoolsToolchain, AutotoolsDeps, PkgConfigDeps
 from conan.tools.layout import basic_layout
@@ -30,6 +32,7 @@ class CPythonConan(ConanFile):
         "fPIC": [True, False],
         "optimizations": [True, False],
         "lto": [True, False],
+        "bolt": [True, False],
         "docstrings": [True, False],
         "pymalloc": [True, False],
         "with_bz2": [True, False],
@@ -39,6 +42,7 @@ class CPythonConan(ConanFile):
         "with_tkinter": [True, False],
         "with_curses": [True, False],
         "with_lzma": [True, False],
+        "stdlib_zip": [True, False],
 
         # options that don't change package id
         "env_vars": [True, False],  # set environment variables
@@ -48,6 +52,7 @@ class CPythonConan(ConanFile):
         "fPIC": True,
         "optimizations": False,
         "lto": False,
+        "bolt": False,
         "docstrings": True,
         "pymalloc": True,
         "with_bz2": True,
@@ -57,6 +62,7 @@ class CPythonConan(ConanFile):
         "with_tkinter": True,
         "with_curses": True,
         "with_lzma": True,
+        "stdlib_zip": False,
 
         # options that don't change package id
         "env_vars": True,
@@ -79,8 +85,12 @@ class CPythonConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if Version(self.version) < "3.12" or self.settings.os != "Linux":
+            # llvm-bolt only handles ELF binaries
+            del self.options.bolt
         if is_msvc(self):
             del self.options.lto
+            del self.options.stdlib_zip
             del self.options.docstrings
             del self.options.pymalloc
             del self.options.with_curses
@@ -183,6 +193,14 @@ class CPythonConan(ConanFile):
                 if self.dependencies["mpdecimal"].ref.version < Version("2.5.0"):
                     raise ConanInvalidConfiguration("cpython 3.9.0 (and newer) requires (at least) mpdecimal 2.5.0")
 
+        if self.options.get_safe("stdlib_zip") and cross_building(self):
+            # The bytecode must be generated by the packaged interpreter itself
+            raise ConanInvalidConfiguration("stdlib_zip=True is not supported when cross-building")
+
+        if self.options.get_safe("bolt") and cross_building(self):
+            # The BOLT profile is gathered by running the freshly built interpreter
+            raise ConanInvalidConfiguration("bolt=True is not supported when cross-building")
+
         if self.settings.compiler == "gcc" and Version(self.settings.compiler.version).major == 9 and Version(self.version) >= "3.12":
             raise ConanInvalidConfiguration("FIXME: GCC 9 produces an internal compiler error locally, and a link error in CCI")
 
@@ -206,6 +224,9 @@ class CPythonConan(ConanFile):
         ]
         if Version(self.version) < "3.12":
             tc.configure_args.append("--with-system-ffi")
+        if self.options.get_safe("bolt"):
+            # Requires llvm-bolt and merge-fdata to be available in the build environment
+            tc.configure_args.append("--enable-bolt")
         if Version(self.version) >= "3.10":
             tc.configure_args.append("--disable-test-modules")
         if self.options.get_safe("with_sqlite3"):
@@ -759,10 +780,62 @@ class CPythonConan(ConanFile):
 
             if not os.path.exists(self._cpython_symlink):
                 os.symlink(f"python{self._version_suffix}", self._cpython_symlink)
+
+            if self.options.stdlib_zip:
+                self._package_stdlib_zip()
         fix_apple_shared_install_name(self)
 
         self._write_cmake_findpython_wrapper_file()
 
+    @property
+    def _stdlib_folder(self):
+        return os.path.join(self.package_folder, "lib", f"python{self._version_suffix}")
+
+    @property
+    def _stdlib_zip_path(self):
+        # Same name as the entry getpath adds to the default sys.path
+        v = Version(self.version)
+        return os.path.join(self.package_folder, "lib", f"python{v.major}{v.minor}.zip")
+
+    def _package_stdlib_zip(self):
+        stdlib = self._stdlib_folder
+        # Compile to legacy .pyc files next to the sources (zipimport does not look into __pycache__),
+        # stripping docstrings as well if the interpreter was built without them
+        optimize = "-O" if self.options.docstrings else "-OO"
+        env = Environment()
+        env.prepend_path("LD_LIBRARY_PATH", os.path.join(self.package_folder, "lib"))
+        env.prepend_path("DYLD_LIBRARY_PATH", os.path.join(self.package_folder, "lib"))
+        with env.vars(self).apply():
+            # Same exclusions as the "libinstall" target of the upstream Makefile
+            exclude = "bad_coding|badsyntax|site-packages|lib-dynload|lib2to3/tests/data|test_lib2to3/data"
+            self.run(f"\"{self._cpython_interpreter_path}\" {optimize} -m compileall -b -q -j 0 -x \"{exclude}\" \"{stdlib}\"")
+
+        # Extension modules, site-packages and the build configuration (Makefile, static libpython)
+        # must stay on the filesystem
+        def kept_on_disk(relpath):
+            top = relpath.split(os.sep)[0]
+            return top in ("lib-dynload", "site-packages") or top.startswith("config-")
+
+        # Stored uncompressed: zipimport then neither needs zlib nor spends time inflating at startup
+        with zipfile.ZipFile(self._stdlib_zip_path, "w", zipfile.ZIP_STORED) as archive:
+            for root, dirs, files in os.walk(stdlib):
+                dirs[:] = [d for d in dirs if d != "__pycache__" and not kept_on_disk(os.path.relpath(os.path.join(root, d), stdlib))]
+                for filename in files:
+                    if filename.endswith(".py"):
+                        continue
+                    filepath = os.path.join(root, filename)
+                    archive.write(filepath, os.path.relpath(filepath, stdlib).replace(os.sep, "/"))
+
+        for entry in os.listdir(stdlib):
+            if kept_on_disk(entry) or entry == "os.py":
+                # os.py is the landmark getpath uses to locate the prefix of a relocated package
+                continue
+            path = os.path.join(stdlib, entry)
+            if os.path.isdir(path):
+                rmdir(self, path)
+            else:
+                os.remove(path)
+
     @property
     def _cpython_symlink(self):
         symlink = os.path.join(self.package_folder, "bin", "python")
@@ -931,6 +1004,16 @@ class CPythonConan(ConanFile):
                 self.output.info(f"Setting PYTHONHOME environment variable: {pythonhome}")
                 self.env_info.PYTHONHOME = pythonhome
 
+        if self.options.get_safe("stdlib_zip"):
+            stdlib_zip = self._stdlib_zip_path
+            if self.options.env_vars:
+                self.runenv_info.prepend_path("PYTHONPATH", stdlib_zip)
+                self.buildenv_info.prepend_path("PYTHONPATH", stdlib_zip)
+
+                # TODO remove once Conan 1.x is no longer supported
+                self.output.info(f"Prepending PYTHONPATH environment variable: {stdlib_zip}")
+                self.env_info.PYTHONPATH.append(stdlib_zip)
+
         python_root = self.package_folder
         if self.options.env_vars:
             self.runenv_info.append_path("PYTHON_ROOT", python_root)
@@ -139,6 +139,20 @@ class TestPackageConan(ConanFile):
                     f"python reported wrong version. Expected {self._py_version}. Got {version_detected}."
                 )
 
+            buffer = StringIO()
+            self.run(f"{self._python} \"{self.source_folder}/test_package.py\" -b \"{self.build_folder}\" -t interpreter", buffer, env="conanrun")
+            self.output.info(buffer.getvalue())
+            bolt = bool(self._cpython_option("bolt"))
+            if f"BOLT optimized: {bolt}" not in buffer.getvalue():
+                raise ConanException(f"python reported wrong BOLT status. Expected {bolt}.")
+
+            buffer = StringIO()
+            self.run(f"{self._python} \"{self.source_folder}/test_package.py\" -b \"{self.build_folder}\" -t stdlib", buffer, env="conanrun")
+            self.output.info(buffer.getvalue())
+            stdlib_zip = bool(self._cpython_option("stdlib_zip"))
+            if f"stdlib zipped: {stdlib_zip}" not in buffer.getvalue():
+                raise ConanException(f"python imported the stdlib from the wrong location. Expected zipped={stdlib_zip}.")
+
             if self._supports_modules:
                 self._test_module("gdbm", self._cpython_option("with_gdbm"))
                 self._test_module("bz2", self._cpython_option("with_bz2"))
@@ -189,6 +189,26 @@ def test_ssl():
     print("default_context.options={}".format(default_context.options))
 
 
+@add_test
+def test_interpreter():
+    import sysconfig
+
+    # sys._is_gil_enabled() is only available since 3.13, the GIL is always enabled before
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    print("free-threaded build: {}".format(bool(sysconfig.get_config_var("Py_GIL_DISABLED"))))
+    print("GIL enabled: {}".format(is_gil_enabled() if is_gil_enabled else True))
+    print("JIT built: {}".format("_Py_JIT" in (sysconfig.get_config_var("PY_CORE_CFLAGS") or "")))
+    print("BOLT optimized: {}".format("--enable-bolt" in (sysconfig.get_config_var("CONFIG_ARGS") or "")))
+
+
+@add_test
+def test_stdlib():
+    # os is frozen since 3.11, json is a regular stdlib package
+    import json
+
+    print("stdlib zipped: {}".format(".zip" in json.__file__))
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("-b", dest="build_folder", help="build_folder", required=True)
@@ -1,8 +1,11 @@
 from conan import ConanFile
+from conan.errors import ConanException
 from conan.tools.build import check_min_cppstd, valid_min_cppstd
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import copy, get, rmdir
+from conan.tools.files import copy, get, load, rmdir
+from conan.tools.microsoft import is_msvc
 import os
+import re
 
 required_conan_version = ">=1.53.0"
 
@@ -20,19 +23,32 @@ class crc32cConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "require_hardware_acceleration": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "require_hardware_acceleration": False,
     }
 
     @property
     def _min_cppstd(self):
         return "11"
 
+    @property
+    def _hardware_acceleration_check(self):
+        # CMake check result guarding the accelerated implementation for this target
+        if self.settings.arch in ["x86", "x86_64"]:
+            return "HAVE_SSE42"
+        if self.settings.arch == "armv8" and not is_msvc(self):
+            return "HAVE_ARM64_CRC32C"
+        return None
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if not self._hardware_acceleration_check:
+            del self.options.require_hardware_acceleration
 
     def configure(self):
         if self.options.shared:
@@ -41,6 +57,10 @@ class crc32cConan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def package_id(self):
+        # only turns a silent fallback into a build error, the binary is the same
+        self.info.options.rm_safe("require_hardware_acceleration")
+
     def validate(self):
         if self.settings.compiler.get_safe("cppstd"):
             check_min_cppstd(self, self._min_cppstd)
@@ -59,9 +79,18 @@ class crc32cConan(ConanFile):
         tc.variables["CMAKE_WINDOWS_EXPORT_ALL_SYMBOLS"] = True
         tc.generate()
 
+    def _check_hardware_acceleration(self):
+        # crc32c silently falls back to the portable implementation if its compiler checks fail
+        variable = self._hardware_acceleration_check
+        cmake_cache = load(self, os.path.join(self.build_folder, "CMakeCache.txt"))
+        if not re.search(rf"^{variable}:INTERNAL=1$", cmake_cache, re.MULTILINE):
+            raise ConanException(f"{self.ref} would be built without its accelerated implementation ({variable} check failed)")
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
+        if self.options.get_safe("require_hardware_acceleration"):
+            self._check_hardware_acceleration()
         cmake.build()
 
     def package(self):
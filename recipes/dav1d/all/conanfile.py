@@ -26,6 +26,7 @@ class Dav1dConan(ConanFile):
         "with_tools": [True, False],
         "assembly": [True, False],
         "with_avx512": ["deprecated", True, False],
+        "trim_dsp": ["if-release", True, False],
     }
     default_options = {
         "shared": False,
@@ -34,6 +35,7 @@ class Dav1dConan(ConanFile):
         "with_tools": True,
         "assembly": True,
         "with_avx512": "deprecated",
+        "trim_dsp": "if-release",
     }
 
     def config_options(self):
@@ -79,6 +81,8 @@ class Dav1dConan(ConanFile):
             tc.project_options["bitdepths"] = "8,16"
         else:
             tc.project_options["bitdepths"] = str(self.options.bit_depth)
+        # trimming drops rarely used DSP code paths to reduce binary size
+        tc.project_options["trim_dsp"] = str(self.options.trim_dsp).lower()
         tc.generate()
 
     def _patch_sources(self):
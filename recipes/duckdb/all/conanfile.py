@@ -40,6 +40,9 @@ class DuckdbConan(ConanFile):
         "with_shell": [True, False],
         "with_threads": [True, False],
         "with_rdtsc": [True, False],
+        "with_jemalloc": [True, False],
+        "native_arch": [True, False],
+        "unity_build": [True, False],
     }
     default_options = {
         "shared": False,
@@ -61,6 +64,9 @@ class DuckdbConan(ConanFile):
         "with_shell": False,
         "with_threads": True,
         "with_rdtsc": False,
+        "with_jemalloc": True,
+        "native_arch": False,
+        "unity_build": True,
     }
     short_paths = True
 
@@ -76,6 +82,12 @@ class DuckdbConan(ConanFile):
             del self.options.fPIC
         if Version(self.version) >= "0.9.0":
             del self.options.with_parquet
+        if Version(self.version) < "0.9.0" or self.settings.os != "Linux":
+            # the jemalloc extension is only supported on Linux
+            del self.options.with_jemalloc
+        elif Version(self.version) >= "0.10.1" and self.settings.arch != "x86_64":
+            # upstream only enables it by default on x86_64 since 0.10.1
+            self.options.with_jemalloc = False
 
     def configure(self):
         if self.options.shared:
@@ -98,6 +110,11 @@ class DuckdbConan(ConanFile):
         if Version(self.version) >= "0.9.2" and \
                 is_msvc(self) and self.options.shared and self.settings.build_type == "Debug":
             raise ConanInvalidConfiguration(f"{self.ref} does not support MSVC debug shared build")
+        if self.options.native_arch:
+            if is_msvc(self):
+                raise ConanInvalidConfiguration(f"{self.ref} does not support native_arch with MSVC")
+            if cross_building(self):
+                raise ConanInvalidConfiguration(f"{self.ref} can't be built with native_arch when cross-building")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], destination=self.source_folder, strip_root=True)
@@ -136,7 +153,11 @@ class DuckdbConan(ConanFile):
                 build_extensions += ";inet"
             if self.options.with_sqlsmith:
                 build_extensions += ";sqlsmith"
+            if self.options.get_safe("with_jemalloc"):
+                build_extensions += ";jemalloc"
             tc.variables["BUILD_EXTENSIONS"] = build_extensions
+            # jemalloc is loaded by default on Linux, it has to be skipped explicitly
+            tc.variables["SKIP_EXTENSIONS"] = "" if self.options.get_safe("with_jemalloc", True) else "jemalloc"
         else:
             tc.variables["BUILD_ICU_EXTENSION"] = self.options.with_icu
             tc.variables["BUILD_TPCH_EXTENSION"] = self.options.with_tpch
@@ -154,6 +175,8 @@ class DuckdbConan(ConanFile):
         tc.variables["DISABLE_THREADS"] = not self.options.with_threads
         tc.variables["BUILD_UNITTESTS"] = False
         tc.variables["BUILD_RDTSC"] = self.options.with_rdtsc
+        tc.variables["NATIVE_ARCH"] = self.options.native_arch
+        tc.variables["DISABLE_UNITY"] = not self.options.unity_build
         tc.variables["EXTENSION_STATIC_BUILD"] = not self.options.shared
         tc.variables["ENABLE_SANITIZER"] = False
         tc.variables["ENABLE_UBSAN"] = False
@@ -232,8 +255,10 @@ class DuckdbConan(ConanFile):
                 self.cpp_info.libs.append("visualizer_extension")
             if self.options.with_httpfs:
                 self.cpp_info.libs.append("httpfs_extension")
-            if (Version(self.version) >= "0.6.0" and self.settings.os == "Linux" and 
-                (Version(self.version) < "0.10.1" or self.settings.arch == "x86_64")):
+            if Version(self.version) >= "0.9.0":
+                if self.options.get_safe("with_jemalloc"):
+                    self.cpp_info.libs.append("jemalloc_extension")
+            elif Version(self.version) >= "0.6.0" and self.settings.os == "Linux":
                 self.cpp_info.libs.append("jemalloc_extension")
             if self.options.with_json:
                 self.cpp_info.libs.append("json_extension")
@@ -74,6 +74,7 @@ class FFMpegConan(ConanFile):
         "with_libsvtav1": [True, False],
         "with_libaom": [True, False],
         "with_libdav1d": [True, False],
+        "preset": [None, "minimal-decode", "h264-hevc-transcode", "audio-only", "av1-stack"],
         "disable_everything": [True, False],
         "disable_all_encoders": [True, False],
         "disable_encoders": [None, "ANY"],
@@ -154,6 +155,7 @@ class FFMpegConan(ConanFile):
         "with_libsvtav1": True,
         "with_libaom": True,
         "with_libdav1d": True,
+        "preset": None,
         "disable_everything": False,
         "disable_all_encoders": False,
         "disable_encoders": None,
@@ -227,6 +229,69 @@ class FFMpegConan(ConanFile):
             "with_libdav1d": ["avcodec"],
         }
 
+    @property
+    def _presets(self):
+        # Each preset starts from --disable-everything, enables only the listed components and
+        # keeps only the options listed in "options" among _preset_managed_options left to their
+        # default value
+        return {
+            "minimal-decode": {
+                "options": ["avcodec", "avformat", "swresample", "swscale"],
+                "decoder": ["h264", "hevc", "vp8", "vp9", "aac", "mp3", "opus", "vorbis"],
+                "demuxer": ["mov", "matroska", "mpegts", "ogg", "mp3", "aac"],
+                "parser": ["h264", "hevc", "vp8", "vp9", "aac", "mpegaudio", "opus", "vorbis"],
+                "bsf": ["h264_mp4toannexb", "hevc_mp4toannexb"],
+                "protocol": ["file", "pipe"],
+            },
+            "h264-hevc-transcode": {
+                "options": ["avcodec", "avformat", "avfilter", "swresample", "swscale",
+                            "with_zlib", "with_libx264", "with_libx265"],
+                "decoder": ["h264", "hevc", "aac", "mp3"],
+                "encoder": ["libx264", "libx265", "aac"],
+                "demuxer": ["mov", "matroska", "mpegts", "flv", "aac", "mp3"],
+                "muxer": ["mp4", "mov", "matroska", "mpegts", "hls"],
+                "parser": ["h264", "hevc", "aac", "mpegaudio"],
+                "bsf": ["h264_mp4toannexb", "hevc_mp4toannexb", "aac_adtstoasc"],
+                "protocol": ["file", "pipe"],
+                "filter": ["buffer", "buffersink", "abuffer", "abuffersink", "format", "aformat",
+                           "scale", "aresample", "fps", "null", "anull"],
+            },
+            "audio-only": {
+                "options": ["avcodec", "avformat", "avfilter", "swresample",
+                            "with_opus", "with_vorbis", "with_libmp3lame"],
+                "decoder": ["aac", "mp3", "opus", "vorbis", "flac", "pcm_s16le", "pcm_f32le"],
+                "encoder": ["aac", "libopus", "libvorbis", "libmp3lame", "flac", "pcm_s16le"],
+                "demuxer": ["aac", "mp3", "ogg", "flac", "wav", "mov", "matroska"],
+                "muxer": ["adts", "mp3", "ogg", "opus", "flac", "wav", "ipod", "matroska"],
+                "parser": ["aac", "mpegaudio", "opus", "vorbis", "flac"],
+                "protocol": ["file", "pipe"],
+                "filter": ["abuffer", "abuffersink", "aformat", "aresample", "anull", "volume"],
+            },
+            "av1-stack": {
+                "options": ["avcodec", "avformat", "swresample", "swscale",
+                            "with_opus", "with_libdav1d", "with_libaom", "with_libsvtav1"],
+                "decoder": ["libdav1d", "opus"],
+                "encoder": ["libaom_av1", "libsvtav1", "libopus"],
+                "demuxer": ["ivf", "matroska", "mov", "obu"],
+                "muxer": ["ivf", "matroska", "webm", "mp4"],
+                "parser": ["av1", "opus"],
+                "bsf": ["av1_frame_merge", "av1_frame_split", "av1_metadata"],
+                "protocol": ["file", "pipe"],
+            },
+        }
+
+    @property
+    def _preset_managed_options(self):
+        return [
+            "avdevice", "avcodec", "avformat", "swresample", "swscale", "postproc", "avfilter",
+            "with_zlib", "with_bzip2", "with_lzma", "with_libiconv", "with_freetype", "with_openjpeg",
+            "with_openh264", "with_opus", "with_vorbis", "with_zeromq", "with_sdl", "with_libx264",
+            "with_libx265", "with_libvpx", "with_libmp3lame", "with_libfdk_aac", "with_libwebp",
+            "with_ssl", "with_libalsa", "with_pulse", "with_vaapi", "with_vdpau", "with_vulkan",
+            "with_xcb", "with_appkit", "with_avfoundation", "with_coreimage", "with_audiotoolbox",
+            "with_videotoolbox", "with_programs", "with_libsvtav1", "with_libaom", "with_libdav1d",
+        ]
+
     @property
     def _version_supports_vulkan(self):
         return Version(self.version) >= "4.3.0"
@@ -272,6 +337,13 @@ class FFMpegConan(ConanFile):
             self.options.rm_safe("fPIC")
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
+        if self.options.preset:
+            preset_options = self._presets[str(self.options.preset)]["options"]
+            for option in self._preset_managed_options:
+                value = self.options.get_safe(option)
+                # values explicitly changed by the user take precedence over the preset
+                if value is not None and str(value) == str(self.default_options[option]):
+                    setattr(self.options, option, option in preset_options)
 
     def layout(self):
         basic_layout(self, src_folder="src")
@@ -347,6 +419,24 @@ class FFMpegConan(ConanFile):
                 raise ConanInvalidConfiguration("FFmpeg '{}' option requires '{}' option to be enabled".format(
                     dependency, "' or '".join(features)))
 
+        if self.options.preset:
+            for option in self._presets[str(self.options.preset)]["options"]:
+                if not self.options.get_safe(option):
+                    raise ConanInvalidConfiguration(
+                        f"FFmpeg preset '{self.options.preset}' requires '{option}' option, "
+                        f"which is disabled or not available for {self.ref} on {self.settings.os}")
+            disable_all_options = [
+                "disable_everything", "disable_all_encoders", "disable_all_decoders",
+                "disable_all_hardware_accelerators", "disable_all_muxers", "disable_all_demuxers",
+                "disable_all_parsers", "disable_all_bitstream_filters", "disable_all_protocols",
+                "disable_all_devices", "disable_all_input_devices", "disable_all_output_devices",
+                "disable_all_filters",
+            ]
+            if any(self.options.get_safe(option) for option in disable_all_options):
+                raise ConanInvalidConfiguration(
+                    "FFmpeg 'preset' option already disables everything it doesn't list, "
+                    "it can't be combined with 'disable_everything' or 'disable_all_*' options")
+
     def build_requirements(self):
         if self.settings.arch in ("x86", "x86_64"):
             self.tool_requires("yasm/1.3.0")
@@ -536,6 +626,13 @@ class FFMpegConan(ConanFile):
         opt_append_disable_if_set(args, "outdevs", self.options.disable_all_output_devices)
         opt_append_disable_if_set(args, "filters", self.options.disable_all_filters)
 
+        # Preset components come before the enable_*/disable_* lists, so that these can amend a preset
+        if self.options.preset:
+            args.append("--disable-everything")
+            for component_type, components in self._presets[str(self.options.preset)].items():
+                if component_type != "options":
+                    args.extend(f"--enable-{component_type}={component}" for component in components)
+
         args.extend(self._split_and_format_options_string(
             "enable-encoder", self.options.enable_encoders))
         args.extend(self._split_and_format_options_string(
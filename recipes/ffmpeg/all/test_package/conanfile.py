@@ -1,12 +1,12 @@
 from conan import ConanFile
 from conan.tools.build import can_run
-from conan.tools.cmake import CMake, cmake_layout
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 import os
 
 
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
-    generators = "CMakeDeps", "CMakeToolchain", "VirtualRunEnv"
+    generators = "CMakeDeps", "VirtualRunEnv"
     test_type = "explicit"
 
     def layout(self):
@@ -15,6 +15,43 @@ class TestPackageConan(ConanFile):
     def requirements(self):
         self.requires(self.tested_reference_str)
 
+    @property
+    def _preset_codecs(self):
+        # registered codec names which must (or must not) be available with each preset
+        return {
+            "minimal-decode": {
+                "decoders": ["h264", "hevc", "vp9", "aac", "opus"],
+                "encoders": [],
+                "absent_decoders": ["mpeg4"],
+            },
+            "h264-hevc-transcode": {
+                "decoders": ["h264", "hevc", "aac"],
+                "encoders": ["libx264", "libx265", "aac"],
+                "absent_decoders": ["mpeg4"],
+            },
+            "audio-only": {
+                "decoders": ["aac", "mp3", "opus", "flac"],
+                "encoders": ["aac", "libopus", "libvorbis", "libmp3lame", "flac"],
+                "absent_decoders": ["h264"],
+            },
+            "av1-stack": {
+                "decoders": ["libdav1d"],
+                "encoders": ["libaom-av1", "libsvtav1", "libopus"],
+                "absent_decoders": ["h264"],
+            },
+        }
+
+    def generate(self):
+        tc = CMakeToolchain(self)
+        preset = self.dependencies["ffmpeg"].options.preset
+        if preset:
+            codecs = self._preset_codecs[str(preset)]
+            tc.variables["FFMPEG_PRESET"] = str(preset)
+            tc.variables["FFMPEG_EXPECTED_DECODERS"] = ",".join(codecs["decoders"])
+            tc.variables["FFMPEG_EXPECTED_ENCODERS"] = ",".join(codecs["encoders"])
+            tc.variables["FFMPEG_ABSENT_DECODERS"] = ",".join(codecs["absent_decoders"])
+        tc.generate()
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
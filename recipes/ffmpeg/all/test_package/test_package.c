@@ -20,12 +20,40 @@
 
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
+
+#if defined(HAVE_FFMPEG_AVCODEC) && defined(FFMPEG_PRESET)
+static int check_codecs(const char *names, int encoder, int expected)
+{
+    char buffer[256];
+    char *name;
+    int failures = 0;
+    strncpy(buffer, names, sizeof(buffer) - 1);
+    buffer[sizeof(buffer) - 1] = '\0';
+    for (name = strtok(buffer, ","); name; name = strtok(NULL, ",")) {
+        const AVCodec *codec = encoder ? avcodec_find_encoder_by_name(name) : avcodec_find_decoder_by_name(name);
+        if ((codec != NULL) != expected) {
+            fprintf(stderr, "%s %s should%s be registered with preset %s\n",
+                    encoder ? "encoder" : "decoder", name, expected ? "" : " not", FFMPEG_PRESET);
+            ++failures;
+        }
+    }
+    return failures;
+}
+#endif
 
 int main()
 {
     #ifdef HAVE_FFMPEG_AVCODEC
         printf("configuration: %s\n", avcodec_configuration());
         printf("avcodec version: %d.%d.%d\n", AV_VERSION_MAJOR(avcodec_version()), AV_VERSION_MINOR(avcodec_version()), AV_VERSION_MICRO(avcodec_version()));
+        #ifdef FFMPEG_PRESET
+            if (check_codecs(FFMPEG_EXPECTED_DECODERS, 0, 1) +
+                check_codecs(FFMPEG_EXPECTED_ENCODERS, 1, 1) +
+                check_codecs(FFMPEG_ABSENT_DECODERS, 0, 0)) {
+                return EXIT_FAILURE;
+            }
+        #endif
     #else
         printf("avcodec is disabled!\n");
     #endif
@@ -20,10 +20,14 @@ class FlacConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "assembly": [True, False],
+        "with_avx": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "assembly": True,
+        "with_avx": True,
     }
 
     def export_sources(self):
@@ -32,16 +36,26 @@ class FlacConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.arch not in ["x86", "x86_64"]:
+            del self.options.with_avx
 
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if not self.options.assembly:
+            self.options.rm_safe("with_avx")
+
+    @property
+    def _with_nasm(self):
+        # nasm sources were dropped upstream in favour of intrinsics
+        return Version(self.version) < "1.4.2" and self.options.assembly and \
+               self.settings.arch in ["x86", "x86_64"]
 
     def requirements(self):
         self.requires("ogg/1.3.5")
 
     def build_requirements(self):
-        if Version(self.version) < "1.4.2" and self.settings.arch in ["x86", "x86_64"]:
+        if self._with_nasm:
             self.tool_requires("nasm/2.15.05")
 
     def layout(self):
@@ -56,11 +70,13 @@ class FlacConan(ConanFile):
         tc.variables["BUILD_EXAMPLES"] = False
         tc.variables["BUILD_DOCS"] = False
         tc.variables["BUILD_TESTING"] = False
+        tc.variables["WITH_ASM"] = self.options.assembly
+        tc.variables["WITH_AVX"] = self.options.get_safe("with_avx", False)
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0077"] = "NEW"
         tc.generate()
         cd = CMakeDeps(self)
         cd.generate()
-        if self.settings.arch in ["x86", "x86_64"]:
+        if self._with_nasm:
             envbuild = VirtualBuildEnv(self)
             envbuild.generate(scope="build")
 
@@ -2,3 +2,12 @@
 if (TARGET check_epollexclusive)
     set_target_properties(check_epollexclusive PROPERTIES LINKER_LANGUAGE CXX)
 endif()
+
+# Link gRPC libraries & executables against the allocator selected by the recipe
+if(CONAN_GRPC_ALLOCATOR STREQUAL "jemalloc")
+    find_package(jemalloc REQUIRED CONFIG)
+    link_libraries(jemalloc::jemalloc)
+elseif(CONAN_GRPC_ALLOCATOR STREQUAL "tcmalloc")
+    find_package(gperftools REQUIRED CONFIG)
+    link_libraries(gperftools::gperftools)
+endif()
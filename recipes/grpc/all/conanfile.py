@@ -36,7 +36,9 @@ class GrpcConan(ConanFile):
         "php_plugin": [True, False],
         "python_plugin": [True, False],
         "ruby_plugin": [True, False],
-        "secure": [True, False]
+        "secure": [True, False],
+        "allocator": ["system", "jemalloc", "tcmalloc"],
+        "poll_strategy": [None, "epoll1", "poll"],
     }
     default_options = {
         "shared": False,
@@ -51,6 +53,8 @@ class GrpcConan(ConanFile):
         "python_plugin": True,
         "ruby_plugin": True,
         "secure": False,
+        "allocator": "system",
+        "poll_strategy": None,  # None means upstream default ("all"), GRPC_POLL_STRATEGY env var still has precedence
     }
 
     short_paths = True
@@ -75,6 +79,7 @@ class GrpcConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+            del self.options.poll_strategy
 
     def configure(self):
         if self.options.shared:
@@ -103,6 +108,10 @@ class GrpcConan(ConanFile):
         self.requires("zlib/[>=1.2.11 <2]")
         if self.settings.os in ["Linux", "FreeBSD"] and Version(self.version) >= "1.52":
             self.requires("libsystemd/255")
+        if self.options.allocator == "jemalloc":
+            self.requires("jemalloc/5.3.0")
+        elif self.options.allocator == "tcmalloc":
+            self.requires("gperftools/2.15")
 
     def package_id(self):
         del self.info.options.secure
@@ -118,6 +127,9 @@ class GrpcConan(ConanFile):
         if self.settings.compiler.get_safe("cppstd"):
             check_min_cppstd(self, self._cxxstd_required)
 
+        if self.options.get_safe("poll_strategy") == "epoll1" and self.settings.os != "Linux":
+            raise ConanInvalidConfiguration("epoll1 poll strategy is only available on Linux")
+
         if self.options.shared and not self.dependencies.host["protobuf"].options.shared:
             raise ConanInvalidConfiguration(
                 "If built as shared protobuf must be shared as well. "
@@ -174,6 +186,9 @@ class GrpcConan(ConanFile):
         tc.cache_variables["gRPC_BUILD_GRPC_PYTHON_PLUGIN"] = self.options.python_plugin
         tc.cache_variables["gRPC_BUILD_GRPC_RUBY_PLUGIN"] = self.options.ruby_plugin
 
+        # Consumed in conan_cmake_project_include.cmake
+        tc.cache_variables["CONAN_GRPC_ALLOCATOR"] = str(self.options.allocator)
+
         # Consumed targets (abseil) via interface target_compiler_feature can propagate newer standards
         if not valid_min_cppstd(self, self._cxxstd_required):
             tc.cache_variables["CMAKE_CXX_STANDARD"] = self._cxxstd_required
@@ -204,6 +219,13 @@ class GrpcConan(ConanFile):
             replace_in_file(self, os.path.join(self.source_folder, "CMakeLists.txt"),
                             "COMMAND ${_gRPC_PROTOBUF_PROTOC_EXECUTABLE}",
                             'COMMAND ${CMAKE_COMMAND} -E env "DYLD_LIBRARY_PATH=$ENV{DYLD_LIBRARY_PATH}" ${_gRPC_PROTOBUF_PROTOC_EXECUTABLE}')
+
+        # Default value of GRPC_POLL_STRATEGY
+        if self.options.get_safe("poll_strategy"):
+            replace_in_file(self, os.path.join(self.source_folder, "src", "core", "lib", "iomgr", "ev_posix.cc"),
+                            'grpc_poll_strategy, "all",',
+                            f'grpc_poll_strategy, "{self.options.poll_strategy}",')
+
     def build(self):
         self._patch_sources()
         cmake = CMake(self)
@@ -308,6 +330,12 @@ class GrpcConan(ConanFile):
         def corefoundation():
             return ["CoreFoundation"] if is_apple_os(self) else []
 
+        def allocator():
+            return {
+                "jemalloc": ["jemalloc::jemalloc"],
+                "tcmalloc": ["gperftools::gperftools"],
+            }.get(str(self.options.allocator), [])
+
         components = {
             "address_sorting": {
                 "lib": "address_sorting",
@@ -321,7 +349,7 @@ class GrpcConan(ConanFile):
                     "abseil::absl_strings", "abseil::absl_synchronization",
                     "abseil::absl_time", "abseil::absl_optional",
                     "abseil::absl_flags"
-                ] + libsystemd(),
+                ] + libsystemd() + allocator(),
                 "system_libs": libm() + pthread() + crypt32() + ws2_32() + wsock32(),
             },
             "_grpc": {
@@ -24,10 +24,12 @@ class ImathConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "half_lookup_table": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "half_lookup_table": True,
     }
 
     def export_sources(self):
@@ -53,6 +55,9 @@ class ImathConan(ConanFile):
 
     def generate(self):
         tc = CMakeToolchain(self)
+        # half to float conversion through a 256KB lookup table instead of bit manipulation,
+        # F16C instructions take precedence anyway when consumers build with them
+        tc.variables["IMATH_HALF_USE_LOOKUP_TABLE"] = self.options.half_lookup_table
         if is_msvc(self) and self.settings.compiler.get_safe("cppstd"):
             # when msvc is working with a C++ standard level higher
             # than the default, we need the __cplusplus macro to be correct
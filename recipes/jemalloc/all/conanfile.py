@@ -34,6 +34,10 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": [True, False],
         "enable_libdl": [True, False],
         "enable_prof": [True, False],
+        "lg_page": [None, "ANY"],
+        "lg_quantum": [None, "ANY"],
+        "lg_hugepage": [None, "ANY"],
+        "malloc_conf": [None, "ANY"],
     }
     default_options = {
         "shared": False,
@@ -49,6 +53,11 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": True,
         "enable_libdl": True,
         "enable_prof": False,
+        # None values keep jemalloc's detection/defaults
+        "lg_page": None,
+        "lg_quantum": None,
+        "lg_hugepage": None,
+        "malloc_conf": None,  # compiled-in default of MALLOC_CONF, e.g. "background_thread:true,dirty_decay_ms:5000"
     }
 
     @property
@@ -126,6 +135,11 @@ class JemallocConan(ConanFile):
         if self.settings.os == "Macos" and self.settings.arch == "armv8":
             if Version(self.version) < "5.3.0":
                 raise ConanInvalidConfiguration("Support for Apple Silicon is only available as of 5.3.0.")
+        # 5. Verify size classes and page sizes (base 2 logarithms)
+        for option in ["lg_page", "lg_quantum", "lg_hugepage"]:
+            value = self.options.get_safe(option)
+            if value and not str(value).isdigit():
+                raise ConanInvalidConfiguration(f"-o='{self.ref}:{option}' should be a positive integer (base 2 log)")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -149,6 +163,14 @@ class JemallocConan(ConanFile):
             enable_disable("libdl", self.options.enable_libdl),
             enable_disable("prof", self.options.enable_prof),
         ])
+        if self.options.lg_page:
+            tc.configure_args.append(f"--with-lg-page={self.options.lg_page}")
+        if self.options.lg_quantum:
+            tc.configure_args.append(f"--with-lg-quantum={self.options.lg_quantum}")
+        if self.options.lg_hugepage:
+            tc.configure_args.append(f"--with-lg-hugepage={self.options.lg_hugepage}")
+        if self.options.malloc_conf:
+            tc.configure_args.append(f"--with-malloc-conf={self.options.malloc_conf}")
         env = tc.environment()
         if is_msvc(self):
             # Do not check whether the math library exists when compiled by MSVC
@@ -1,5 +1,6 @@
 #include <jemalloc/jemalloc.h>
 
+#include <stdio.h>
 #include <stdlib.h>
 
 void do_something(size_t i) {
@@ -12,6 +13,23 @@ int main() {
         do_something(i);
     }
 
+    // Print compiled-in configuration.
+    const char *malloc_conf = NULL;
+    size_t malloc_conf_size = sizeof(malloc_conf);
+    if (mallctl("config.malloc_conf", &malloc_conf, &malloc_conf_size, NULL, 0) == 0) {
+        printf("config.malloc_conf: \"%s\"\n", malloc_conf ? malloc_conf : "");
+    }
+    size_t page = 0;
+    size_t page_size = sizeof(page);
+    if (mallctl("arenas.page", &page, &page_size, NULL, 0) == 0) {
+        printf("arenas.page: %zu\n", page);
+    }
+    size_t quantum = 0;
+    size_t quantum_size = sizeof(quantum);
+    if (mallctl("arenas.quantum", &quantum, &quantum_size, NULL, 0) == 0) {
+        printf("arenas.quantum: %zu\n", quantum);
+    }
+
     // Dump allocator statistics to stderr.
     malloc_stats_print(NULL, NULL, NULL);
 
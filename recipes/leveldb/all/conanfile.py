@@ -1,7 +1,7 @@
 from conan import ConanFile
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, replace_in_file, rmdir
 import os
 
 required_conan_version = ">=1.53.0"
@@ -25,12 +25,14 @@ class LevelDBCppConan(ConanFile):
         "fPIC": [True, False],
         "with_snappy": [True, False],
         "with_crc32c": [True, False],
+        "with_tcmalloc": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "with_snappy": True,
         "with_crc32c": True,
+        "with_tcmalloc": False,
     }
 
     def export_sources(self):
@@ -39,6 +41,8 @@ class LevelDBCppConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+            # gperftools does not support Windows
+            del self.options.with_tcmalloc
 
     def configure(self):
         if self.options.shared:
@@ -48,13 +52,12 @@ class LevelDBCppConan(ConanFile):
         cmake_layout(self, src_folder="src")
 
     def requirements(self):
-        # FIXME: tcmalloc is also conditionally included in leveldb, but
-        # there is no "official" conan package yet; when that is available, we
-        # can add similar with options for those
         if self.options.with_snappy:
             self.requires("snappy/1.1.10")
         if self.options.with_crc32c:
             self.requires("crc32c/1.1.2")
+        if self.options.get_safe("with_tcmalloc"):
+            self.requires("gperftools/2.15")
 
     def validate(self):
         if self.settings.compiler.get_safe("cppstd"):
@@ -69,12 +72,20 @@ class LevelDBCppConan(ConanFile):
         tc.variables["LEVELDB_BUILD_BENCHMARKS"] = False
         tc.variables["HAVE_SNAPPY"] = self.options.with_snappy
         tc.variables["HAVE_CRC32C"] = self.options.with_crc32c
+        # Also prevents check_library_exists() from picking up a tcmalloc from the system
+        tc.variables["HAVE_TCMALLOC"] = bool(self.options.get_safe("with_tcmalloc"))
         tc.generate()
         deps = CMakeDeps(self)
         deps.generate()
 
-    def build(self):
+    def _patch_sources(self):
         apply_conandata_patches(self)
+        replace_in_file(self, os.path.join(self.source_folder, "CMakeLists.txt"),
+                        "target_link_libraries(leveldb tcmalloc)",
+                        "find_package(gperftools REQUIRED CONFIG)\n  target_link_libraries(leveldb gperftools::gperftools)")
+
+    def build(self):
+        self._patch_sources()
         cmake = CMake(self)
         cmake.configure()
         cmake.build()
@@ -1,4 +1,5 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.env import VirtualBuildEnv
 from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir
@@ -22,11 +23,19 @@ class LibaomAv1Conan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "assembly": [True, False],
+        "with_threads": [True, False],
+        "realtime_only": [True, False],
+        "av1_decoder": [True, False],
+        "av1_encoder": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "assembly": False,
+        "with_threads": True,
+        "realtime_only": False,
+        "av1_decoder": True,
+        "av1_encoder": True,
     }
 
     @property
@@ -47,6 +56,13 @@ class LibaomAv1Conan(ConanFile):
             self.options.rm_safe("fPIC")
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
+        if not self.options.av1_encoder:
+            # only affects the encoder
+            self.options.rm_safe("realtime_only")
+
+    def validate(self):
+        if not self.options.av1_decoder and not self.options.av1_encoder:
+            raise ConanInvalidConfiguration(f"{self.ref} requires at least one of av1_decoder or av1_encoder")
 
     def build_requirements(self):
         if self.options.get_safe("assembly", False):
@@ -76,6 +92,10 @@ class LibaomAv1Conan(ConanFile):
         tc.variables["CONFIG_LIBYUV"] = 0
         # webm is not yet packaged
         tc.variables["CONFIG_WEBM_IO"] = 0
+        tc.variables["CONFIG_MULTITHREAD"] = 1 if self.options.with_threads else 0
+        tc.variables["CONFIG_REALTIME_ONLY"] = 1 if self.options.get_safe("realtime_only") else 0
+        tc.variables["CONFIG_AV1_DECODER"] = 1 if self.options.av1_decoder else 0
+        tc.variables["CONFIG_AV1_ENCODER"] = 1 if self.options.av1_encoder else 0
         # Requires C99 or higher
         tc.variables["CMAKE_C_STANDARD"] = "99"
         tc.generate()
@@ -96,4 +116,6 @@ class LibaomAv1Conan(ConanFile):
         self.cpp_info.set_property("pkg_config_name", "aom")
         self.cpp_info.libs = ["aom"]
         if self.settings.os in ("FreeBSD", "Linux"):
-            self.cpp_info.system_libs = ["pthread", "m"]
+            self.cpp_info.system_libs = ["m"]
+            if self.options.with_threads:
+                self.cpp_info.system_libs.append("pthread")
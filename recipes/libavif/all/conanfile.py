@@ -22,11 +22,13 @@ class LibAVIFConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "with_decoder": ["aom", "dav1d"],
+        "with_encoder": [None, "aom", "svt"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "with_decoder": "dav1d",
+        "with_encoder": "aom",
     }
 
     @property
@@ -53,17 +55,33 @@ class LibAVIFConan(ConanFile):
     def _has_dav1d(self):
         return self.options.with_decoder == "dav1d"
 
+    @property
+    def _has_aom(self):
+        return self.options.with_decoder == "aom" or self.options.with_encoder == "aom"
+
+    @property
+    def _has_svt(self):
+        return self.options.with_encoder == "svt"
+
     def requirements(self):
-        self.requires("libaom-av1/3.6.1")
+        if self._has_aom:
+            self.requires("libaom-av1/3.6.1")
         self.requires("libyuv/1854")
         if self._has_dav1d:
             self.requires("dav1d/1.2.1")
+        if self._has_svt:
+            self.requires("libsvtav1/1.6.0")
         if self._depends_on_sharpyuv:
             self.requires("libwebp/1.3.2")
 
     def validate(self):
         if self._depends_on_sharpyuv and Version(self.dependencies["libwebp"].ref.version) < "1.3.0":
             raise ConanInvalidConfiguration(f"{self.ref} requires libwebp >= 1.3.0 in order to get libsharpyuv")
+        if self._has_svt:
+            if Version(self.version) < "1.0.0":
+                raise ConanInvalidConfiguration(f"{self.ref} doesn't support SVT-AV1 1.x, use with_encoder=aom")
+            if not self.dependencies["libsvtav1"].options.build_encoder:
+                raise ConanInvalidConfiguration(f"{self.ref} requires libsvtav1/*:build_encoder=True")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -71,9 +89,14 @@ class LibAVIFConan(ConanFile):
     def generate(self):
         tc = CMakeToolchain(self)
         tc.variables["AVIF_ENABLE_WERROR"] = False
-        tc.variables["AVIF_CODEC_AOM"] = True
+        tc.variables["AVIF_CODEC_AOM"] = self._has_aom
         tc.variables["AVIF_CODEC_DAV1D"] = self.options.with_decoder == "dav1d"
         tc.variables["AVIF_CODEC_AOM_DECODE"] = self.options.with_decoder == "aom"
+        tc.variables["AVIF_CODEC_AOM_ENCODE"] = self.options.with_encoder == "aom"
+        tc.variables["AVIF_CODEC_SVT"] = self._has_svt
+        if self._has_svt:
+            # libavif includes <svt-av1/EbSvtAv1Enc.h>
+            tc.variables["SVT_INCLUDE_DIR"] = os.path.join(self.dependencies["libsvtav1"].package_folder, "include").replace("\\", "/")
         tc.variables["LIBYUV_VERSION"] = self.dependencies["libyuv"].ref.version
         tc.generate()
         deps = CMakeDeps(self)
@@ -88,6 +111,9 @@ class LibAVIFConan(ConanFile):
         replace_in_file(self, cmakelists, "${DAV1D_LIBRARY}", "dav1d::dav1d")
         replace_in_file(self, cmakelists, "find_package(aom REQUIRED)", "find_package(libaom-av1 REQUIRED CONFIG)")
         replace_in_file(self, cmakelists, "${AOM_LIBRARIES}", "libaom-av1::libaom-av1")
+        if self._has_svt:
+            replace_in_file(self, cmakelists, "find_package(svt REQUIRED)", "find_package(libsvtav1 REQUIRED CONFIG)")
+            replace_in_file(self, cmakelists, "${SVT_LIBRARIES}", "libsvtav1::encoder")
 
     def build(self):
         self._patch_sources()
@@ -128,9 +154,13 @@ class LibAVIFConan(ConanFile):
             if self._has_dav1d:
                 self.cpp_info.system_libs.append("dl")
 
-        self.cpp_info.requires = ["libyuv::libyuv", "libaom-av1::libaom-av1"]
+        self.cpp_info.requires = ["libyuv::libyuv"]
+        if self._has_aom:
+            self.cpp_info.requires.append("libaom-av1::libaom-av1")
         if self._has_dav1d:
             self.cpp_info.requires.append("dav1d::dav1d")
+        if self._has_svt:
+            self.cpp_info.requires.append("libsvtav1::encoder")
         if self._depends_on_sharpyuv:
             self.cpp_info.requires.append("libwebp::sharpyuv")
 
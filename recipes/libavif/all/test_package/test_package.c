@@ -1,5 +1,6 @@
 #include <avif/avif.h>
 #include <stddef.h>
+#include <stdio.h>
 
 int main(int argc, char const* argv[])
 {
@@ -8,5 +9,9 @@ int main(int argc, char const* argv[])
 
   avifFree(NULL);
 
+  char codecVersions[256];
+  avifCodecVersions(codecVersions);
+  printf("libavif codecs: %s\n", codecVersions);
+
   return 0;
 }
@@ -52,6 +52,7 @@ class LibcurlConan(ConanFile):
         "with_libpsl": [True, False],
         "with_largemaxwritesize": [True, False],
         "with_nghttp2": [True, False],
+        "with_http3": [True, False],
         "with_zlib": [True, False],
         "with_brotli": [True, False],
         "with_zstd": [True, False],
@@ -98,6 +99,7 @@ class LibcurlConan(ConanFile):
         "with_libpsl": False,
         "with_largemaxwritesize": False,
         "with_nghttp2": False,
+        "with_http3": False,
         "with_zlib": True,
         "with_brotli": False,
         "with_zstd": False,
@@ -148,6 +150,9 @@ class LibcurlConan(ConanFile):
 
         if Version(self.version) < "8.7.0":
             del self.options.with_misc_docs
+        if Version(self.version) < "8.6.0":
+            # HTTP/3 over the OpenSSL QUIC stack is available since 8.6.0
+            del self.options.with_http3
 
         # Default options
         self.options.with_ssl = "darwinssl" if is_apple_os(self) else "openssl"
@@ -173,6 +178,8 @@ class LibcurlConan(ConanFile):
             self.requires("mbedtls/3.5.0")
         if self.options.with_nghttp2:
             self.requires("libnghttp2/1.59.0")
+        if self.options.get_safe("with_http3"):
+            self.requires("nghttp3/1.3.0")
         if self.options.with_libssh2:
             self.requires("libssh2/1.11.0")
         if self.options.with_zlib:
@@ -197,6 +204,14 @@ class LibcurlConan(ConanFile):
                 raise ConanInvalidConfiguration("option with_ntlm=True requires openssl:no_des=False")
         if self.options.with_ssl == "wolfssl" and not self.dependencies["wolfssl"].options.with_curl:
             raise ConanInvalidConfiguration("option with_ssl=wolfssl requires wolfssl:with_curl=True")
+        if self.options.get_safe("with_http3"):
+            # ngtcp2, quiche and msh3 are not packaged, so the only QUIC stack available is the one of OpenSSL
+            if self.options.with_ssl != "openssl":
+                raise ConanInvalidConfiguration("option with_http3=True requires with_ssl=openssl")
+            if Version(self.dependencies["openssl"].ref.version) < "3.2.0":
+                raise ConanInvalidConfiguration("option with_http3=True requires openssl/3.2.0 or later")
+            if not self.options.with_http:
+                raise ConanInvalidConfiguration("option with_http3=True requires with_http=True")
 
     def build_requirements(self):
         if self._is_using_cmake_build:
@@ -362,6 +377,12 @@ class LibcurlConan(ConanFile):
         replace_in_file(self, cmakelists, "${NGHTTP2_INCLUDE_DIRS}", "${libnghttp2_INCLUDE_DIRS}")
         replace_in_file(self, cmakelists, "${NGHTTP2_LIBRARIES}", "libnghttp2::nghttp2")
 
+        # nghttp3
+        if self.options.get_safe("with_http3"):
+            replace_in_file(self, cmakelists, "find_package(NGHTTP3 REQUIRED)", "find_package(nghttp3 REQUIRED CONFIG)")
+            replace_in_file(self, cmakelists, "${NGHTTP3_INCLUDE_DIRS}", "${nghttp3_INCLUDE_DIRS}")
+            replace_in_file(self, cmakelists, "${NGHTTP3_LIBRARIES}", "nghttp3::nghttp3")
+
         # wolfssl
         replace_in_file(self, cmakelists, "find_package(WolfSSL REQUIRED)", "find_package(wolfssl REQUIRED CONFIG)")
         replace_in_file(self, cmakelists, "${WolfSSL_LIBRARIES}", "${wolfssl_LIBRARIES}")
@@ -460,6 +481,13 @@ class LibcurlConan(ConanFile):
         else:
             tc.configure_args.append("--without-nghttp2")
 
+        if self.options.get_safe("with_http3"):
+            path = unix_path(self, self.dependencies["nghttp3"].package_folder)
+            tc.configure_args.extend([
+                "--with-openssl-quic",
+                f"--with-nghttp3={path}",
+            ])
+
         if self.options.with_zlib:
             path = unix_path(self, self.dependencies["zlib"].package_folder)
             tc.configure_args.append(f"--with-zlib={path}")
@@ -573,6 +601,9 @@ class LibcurlConan(ConanFile):
         tc.variables["CURL_USE_WOLFSSL"] = self.options.with_ssl == "wolfssl"
         tc.variables["CURL_USE_MBEDTLS"] = self.options.with_ssl == "mbedtls"
         tc.variables["USE_NGHTTP2"] = self.options.with_nghttp2
+        if self.options.get_safe("with_http3"):
+            tc.variables["USE_OPENSSL_QUIC"] = True
+            tc.variables["USE_NGHTTP3"] = True
         tc.variables["CURL_ZLIB"] = self.options.with_zlib
         tc.variables["CURL_BROTLI"] = self.options.with_brotli
         tc.variables["CURL_ZSTD"] = self.options.with_zstd
@@ -689,6 +720,8 @@ class LibcurlConan(ConanFile):
             self.cpp_info.components["curl"].requires.append("mbedtls::mbedtls")
         if self.options.with_nghttp2:
             self.cpp_info.components["curl"].requires.append("libnghttp2::libnghttp2")
+        if self.options.get_safe("with_http3"):
+            self.cpp_info.components["curl"].requires.append("nghttp3::nghttp3")
         if self.options.with_libssh2:
             self.cpp_info.components["curl"].requires.append("libssh2::libssh2")
         if self.options.with_zlib:
@@ -23,9 +23,21 @@ int main(void)
     /* provide a buffer to store errors in */
     curl_easy_setopt(curl, CURLOPT_ERRORBUFFER, errbuf);
 
+#ifdef CURL_WITH_HTTP3
+    if(!(id->features & CURL_VERSION_HTTP3)) {
+      printf("HTTP/3 feature not available\n");
+      retval = 4;
+    }
+    else if(curl_easy_setopt(curl, CURLOPT_HTTP_VERSION, (long)CURL_HTTP_VERSION_3) != CURLE_OK) {
+      printf("Failed to select CURL_HTTP_VERSION_3\n");
+      retval = 4;
+    }
+#endif
+
     /* always cleanup */
     curl_easy_cleanup(curl);
-    printf("Succeed\n");
+    if(retval == 0)
+      printf("Succeed\n");
   } else {
     printf("Failed to init curl\n");
     retval = 3;
@@ -1,6 +1,7 @@
 from conan import ConanFile
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.files import collect_libs, copy, get, rmdir
+from conan.tools.microsoft import is_msvc
 import os
 
 required_conan_version = ">=1.53.0"
@@ -18,10 +19,16 @@ class LibdeflateConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "build_gzip": [True, False],
+        "target_arch": [None, "ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "build_gzip": False,
+        # None keeps the portable build with runtime CPU feature dispatch, otherwise value of
+        # -march (or /arch: for msvc) for a known target, e.g. x86-64-v3 or armv8-a+crc+crypto
+        "target_arch": None,
     }
 
     def config_options(self):
@@ -44,8 +51,15 @@ class LibdeflateConan(ConanFile):
         tc = CMakeToolchain(self)
         tc.variables["LIBDEFLATE_BUILD_STATIC_LIB"] = not self.options.shared
         tc.variables["LIBDEFLATE_BUILD_SHARED_LIB"] = self.options.shared
-        tc.variables["LIBDEFLATE_BUILD_GZIP"] = False
+        tc.variables["LIBDEFLATE_BUILD_GZIP"] = self.options.build_gzip
+        tc.variables["LIBDEFLATE_USE_SHARED_LIB"] = self.options.shared
         tc.variables["LIBDEFLATE_BUILD_TESTS"] = False
+        if self.options.target_arch:
+            # With the target features enabled at compile time, libdeflate selects its
+            # CRC32 (PCLMULQDQ/VPCLMULQDQ, ARM CRC32/PMULL), Adler32 and matchfinder
+            # implementations statically instead of dispatching through CPU detection.
+            arch_flag = f"/arch:{self.options.target_arch}" if is_msvc(self) else f"-march={self.options.target_arch}"
+            tc.extra_cflags.append(arch_flag)
         tc.generate()
 
     def build(self):
@@ -76,3 +90,7 @@ class LibdeflateConan(ConanFile):
         self.cpp_info.components["_libdeflate"].names["cmake_find_package_multi"] = f"libdeflate{target_suffix}"
         self.cpp_info.components["_libdeflate"].set_property("cmake_target_name", f"libdeflate::libdeflate{target_suffix}")
         self.cpp_info.components["_libdeflate"].set_property("pkg_config_name", "libdeflate")
+
+        if self.options.build_gzip:
+            # TODO: to remove in conan v2
+            self.env_info.PATH.append(os.path.join(self.package_folder, "bin"))
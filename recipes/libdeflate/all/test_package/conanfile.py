@@ -13,7 +13,8 @@ class TestPackageConan(ConanFile):
         cmake_layout(self)
 
     def requirements(self):
-        self.requires(self.tested_reference_str)
+        self.requires(self.tested_reference_str, run=True)
+        self.requires("zlib/[>=1.2.11 <2]")
 
     def build(self):
         cmake = CMake(self)
@@ -24,3 +25,5 @@ class TestPackageConan(ConanFile):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
             self.run(bin_path, env="conanrun")
+            if self.dependencies["libdeflate"].options.build_gzip:
+                self.run("libdeflate-gzip -V", env="conanrun")
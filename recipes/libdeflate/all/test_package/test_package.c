@@ -1,8 +1,30 @@
 #include <libdeflate.h>
+#include <zlib.h>
+
+#include <stdio.h>
+#include <string.h>
 
 int main () {
     struct libdeflate_compressor *c;
     c = libdeflate_alloc_compressor(12);
     libdeflate_free_compressor(c);
+
+    /* Checksums must match zlib whatever CRC32/Adler32 implementation has been selected */
+    unsigned char buffer[4096];
+    size_t i;
+    for (i = 0; i < sizeof(buffer); ++i) {
+        buffer[i] = (unsigned char)(i * 31 + (i >> 7));
+    }
+
+    unsigned int deflate_crc32 = libdeflate_crc32(0, buffer, sizeof(buffer));
+    unsigned int deflate_adler32 = libdeflate_adler32(1, buffer, sizeof(buffer));
+    unsigned long zlib_crc32 = crc32(0L, buffer, sizeof(buffer));
+    unsigned long zlib_adler32 = adler32(1L, buffer, sizeof(buffer));
+
+    printf("crc32: libdeflate=%08x zlib=%08lx\n", deflate_crc32, zlib_crc32);
+    printf("adler32: libdeflate=%08x zlib=%08lx\n", deflate_adler32, zlib_adler32);
+    if (deflate_crc32 != zlib_crc32 || deflate_adler32 != zlib_adler32) {
+        return 1;
+    }
     return 0;
 }
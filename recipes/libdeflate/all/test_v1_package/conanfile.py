@@ -6,6 +6,9 @@ class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
     generators = "cmake", "cmake_find_package_multi"
 
+    def requirements(self):
+        self.requires("zlib/[>=1.2.11 <2]")
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
@@ -2,6 +2,7 @@ from conan import ConanFile
 from conan.tools.build import check_min_cppstd, stdcpp_library
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir
+from conan.tools.scm import Version
 import os
 
 required_conan_version = ">=1.54.0"
@@ -24,6 +25,7 @@ class LibheifConan(ConanFile):
         "with_x265": [True, False],
         "with_libaomav1": [True, False],
         "with_dav1d": [True, False],
+        "parallel_tile_decoding": [True, False],
     }
     default_options = {
         "shared": False,
@@ -32,6 +34,7 @@ class LibheifConan(ConanFile):
         "with_x265": False,
         "with_libaomav1": False,
         "with_dav1d": False,
+        "parallel_tile_decoding": True,
     }
 
     def export_sources(self):
@@ -40,6 +43,8 @@ class LibheifConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if Version(self.version) < "1.13.0":
+            del self.options.parallel_tile_decoding
 
     def configure(self):
         if self.options.shared:
@@ -74,6 +79,10 @@ class LibheifConan(ConanFile):
         tc.variables["WITH_DAV1D"] = self.options.with_dav1d
         tc.variables["WITH_EXAMPLES"] = False
         tc.variables["WITH_GDK_PIXBUF"] = False
+        if Version(self.version) >= "1.13.0":
+            # decodes the tiles of grid images (most HEIC photos) on several threads,
+            # see heif_context_set_max_decoding_threads()
+            tc.variables["ENABLE_PARALLEL_TILE_DECODING"] = self.options.parallel_tile_decoding
         tc.generate()
         deps = CMakeDeps(self)
         deps.generate()
@@ -1,9 +1,14 @@
-from conans import ConanFile, CMake, tools
+from conan import ConanFile
+from conan.tools.build import cross_building, stdcpp_library
+from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
+from conan.tools.env import VirtualBuildEnv
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, replace_in_file, rm, rmdir
+from conan.tools.gnu import PkgConfigDeps
+import glob
 import os
 import shutil
-import glob
 
-required_conan_version = ">=1.33.0"
+required_conan_version = ">=1.53.0"
 
 
 class LibjxlConan(ConanFile):
@@ -13,84 +18,130 @@ class LibjxlConan(ConanFile):
     url = "https://github.com/conan-io/conan-center-index"
     homepage = "https://github.com/libjxl/libjxl"
     topics = ("image", "jpeg-xl", "jxl", "jpeg")
-
-    settings = "os", "compiler", "build_type", "arch"
-    options = {"shared": [True, False], "fPIC": [True, False]}
-    default_options = {"shared": False, "fPIC": True}
-
-    exports_sources = "CMakeLists.txt", "patches/**"
-    generators = "cmake"
-    _cmake = None
-
-    @property
-    def _source_subfolder(self):
-        return "source_subfolder"
+    package_type = "library"
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "with_threads": [True, False],
+        "with_tcmalloc": [True, False],
+        "simd_targets": ["dynamic", "static", "scalar"],
+        "disabled_simd_targets": [None, "ANY"],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "with_threads": True,
+        "with_tcmalloc": False,
+        "simd_targets": "dynamic",
+        "disabled_simd_targets": None,
+    }
+
+    def export_sources(self):
+        copy(self, "CMakeLists.txt", src=self.recipe_folder, dst=self.export_sources_folder)
+        export_conandata_patches(self)
 
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+            # gperftools does not support Windows
+            del self.options.with_tcmalloc
 
     def configure(self):
         if self.options.shared:
-            del self.options.fPIC
+            self.options.rm_safe("fPIC")
+
+    def layout(self):
+        cmake_layout(self, src_folder="src")
 
     def requirements(self):
-        self.requires("brotli/1.0.9")
+        self.requires("brotli/1.1.0")
         self.requires("highway/0.12.2")
-        self.requires("lcms/2.11")
+        self.requires("lcms/2.16")
+        if self.options.get_safe("with_tcmalloc"):
+            self.requires("gperftools/2.15")
+
+    def build_requirements(self):
+        if self.options.get_safe("with_tcmalloc") and not self.conf.get("tools.gnu:pkg_config", check_type=str):
+            # libjxl looks for libtcmalloc_minimal with pkg-config
+            self.tool_requires("pkgconf/2.1.0")
 
     def source(self):
-        tools.get(**self.conan_data["sources"][self.version],
-                  destination=self._source_subfolder, strip_root=True)
+        get(self, **self.conan_data["sources"][self.version], strip_root=True)
+
+    def generate(self):
+        env = VirtualBuildEnv(self)
+        env.generate()
+
+        tc = CMakeToolchain(self)
+        tc.variables["BUILD_TESTING"] = False
+        tc.variables["JPEGXL_STATIC"] = not self.options.shared
+        tc.variables["JPEGXL_ENABLE_BENCHMARK"] = False
+        tc.variables["JPEGXL_ENABLE_EXAMPLES"] = False
+        tc.variables["JPEGXL_ENABLE_MANPAGES"] = False
+        tc.variables["JPEGXL_ENABLE_SJPEG"] = False
+        tc.variables["JPEGXL_ENABLE_OPENEXR"] = False
+        tc.variables["JPEGXL_ENABLE_SKCMS"] = False
+        tc.variables["JPEGXL_ENABLE_TCMALLOC"] = bool(self.options.get_safe("with_tcmalloc"))
+        if cross_building(self):
+            tc.variables["CMAKE_SYSTEM_PROCESSOR"] = str(self.settings.arch)
+        # highway selects the SIMD targets compiled into libjxl from these definitions:
+        # "static" only keeps the baseline target implied by the compiler flags (no runtime dispatch)
+        if self.options.simd_targets == "static":
+            tc.preprocessor_definitions["HWY_COMPILE_ONLY_STATIC"] = 1
+        elif self.options.simd_targets == "scalar":
+            tc.preprocessor_definitions["HWY_COMPILE_ONLY_SCALAR"] = 1
+        if self.options.disabled_simd_targets:
+            # e.g. "HWY_AVX3" to avoid AVX-512 frequency throttling
+            tc.preprocessor_definitions["HWY_DISABLED_TARGETS"] = str(self.options.disabled_simd_targets)
+        tc.generate()
+
+        deps = CMakeDeps(self)
+        # Target names expected by libjxl, originally provided by its third_party folder
+        deps.set_property("brotli::brotlicommon", "cmake_target_name", "brotlicommon-static")
+        deps.set_property("brotli::brotlidec", "cmake_target_name", "brotlidec-static")
+        deps.set_property("brotli::brotlienc", "cmake_target_name", "brotlienc-static")
+        deps.set_property("highway::hwy", "cmake_target_name", "hwy")
+        deps.generate()
+
+        if self.options.get_safe("with_tcmalloc"):
+            deps = PkgConfigDeps(self)
+            deps.generate()
 
     def _patch_sources(self):
-        for patch in self.conan_data["patches"][self.version]:
-            tools.patch(**patch)
-
-    def _configure_cmake(self):
-        if self._cmake:
-            return self._cmake
-        self._cmake = CMake(self)
-        self._cmake.definitions["BUILD_TESTING"] = False
-        self._cmake.definitions["JPEGXL_STATIC"] = not self.options.shared
-        self._cmake.definitions["JPEGXL_ENABLE_BENCHMARK"] = False
-        self._cmake.definitions["JPEGXL_ENABLE_EXAMPLES"] = False
-        self._cmake.definitions["JPEGXL_ENABLE_MANPAGES"] = False
-        self._cmake.definitions["JPEGXL_ENABLE_SJPEG"] = False
-        self._cmake.definitions["JPEGXL_ENABLE_OPENEXR"] = False
-        self._cmake.definitions["JPEGXL_ENABLE_SKCMS"] = False
-        self._cmake.definitions["JPEGXL_ENABLE_TCMALLOC"] = False
-        if tools.cross_building(self):
-            self._cmake.definitions["CMAKE_SYSTEM_PROCESSOR"] = \
-                str(self.settings.arch)
-        self._cmake.configure()
-        return self._cmake
+        apply_conandata_patches(self)
+        if not self.options.with_threads:
+            replace_in_file(self, os.path.join(self.source_folder, "lib", "CMakeLists.txt"),
+                            "include(jxl_threads.cmake)", "")
 
     def build(self):
         self._patch_sources()
-        cmake = self._configure_cmake()
+        cmake = CMake(self)
+        cmake.configure(build_script_folder=os.path.join(self.source_folder, os.pardir))
         cmake.build()
 
     def package(self):
-        cmake = self._configure_cmake()
+        copy(self, "LICENSE", src=self.source_folder, dst=os.path.join(self.package_folder, "licenses"))
+        cmake = CMake(self)
         cmake.install()
-
-        self.copy("LICENSE", src=self._source_subfolder, dst="licenses")
-        tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
+        rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
 
         if self.options.shared:
             libs_dir = os.path.join(self.package_folder, "lib")
-            tools.remove_files_by_mask(libs_dir, "*.a")
-            tools.remove_files_by_mask(libs_dir, "*-static.lib")
 
+            # libjxl_dec is not installed by upstream, it is built in a subfolder of the build folder
             if self.settings.os == "Windows":
-                self.copy("jxl_dec.dll", src="bin", dst="bin")
-                self.copy("jxl_dec.lib", src="lib", dst="lib")
+                copy(self, "*jxl_dec.dll", src=self.build_folder, dst=os.path.join(self.package_folder, "bin"), keep_path=False)
+                copy(self, "*jxl_dec.lib", src=self.build_folder, dst=libs_dir, keep_path=False)
                 for dll_path in glob.glob(os.path.join(libs_dir, "*.dll")):
-                    shutil.move(dll_path, os.path.join(self.package_folder,
-                                "bin", os.path.basename(dll_path)))
+                    shutil.move(dll_path, os.path.join(self.package_folder, "bin", os.path.basename(dll_path)))
             else:
-                self.copy("libjxl_dec.*", src="lib", dst="lib")
+                # not "*libjxl_dec.*", which would also pick up the generated libjxl_dec.pc
+                copy(self, "*libjxl_dec.so*", src=self.build_folder, dst=libs_dir, keep_path=False)
+                copy(self, "*libjxl_dec*.dylib", src=self.build_folder, dst=libs_dir, keep_path=False)
+
+            rm(self, "*.a", libs_dir)
+            rm(self, "*-static.lib", libs_dir)
 
     def _lib_name(self, name):
         if not self.options.shared and self.settings.os == "Windows":
@@ -99,29 +150,28 @@ class LibjxlConan(ConanFile):
 
     def package_info(self):
         # jxl
-        self.cpp_info.components["jxl"].names["pkg_config"] = "libjxl"
+        self.cpp_info.components["jxl"].set_property("pkg_config_name", "libjxl")
         self.cpp_info.components["jxl"].libs = [self._lib_name("jxl")]
-        self.cpp_info.components["jxl"].requires = ["brotli::brotli",
-                                                    "highway::highway",
-                                                    "lcms::lcms"]
+        self.cpp_info.components["jxl"].requires = ["brotli::brotli", "highway::highway", "lcms::lcms"]
+        if self.options.get_safe("with_tcmalloc"):
+            self.cpp_info.components["jxl"].requires.append("gperftools::tcmalloc_minimal")
         # jxl_dec
-        self.cpp_info.components["jxl_dec"].names["pkg_config"] = "libjxl_dec"
+        self.cpp_info.components["jxl_dec"].set_property("pkg_config_name", "libjxl_dec")
         self.cpp_info.components["jxl_dec"].libs = [self._lib_name("jxl_dec")]
-        self.cpp_info.components["jxl_dec"].requires = ["brotli::brotli",
-                                                        "highway::highway",
-                                                        "lcms::lcms"]
+        self.cpp_info.components["jxl_dec"].requires = ["brotli::brotli", "highway::highway", "lcms::lcms"]
         # jxl_threads
-        self.cpp_info.components["jxl_threads"].names["pkg_config"] = \
-            "libjxl_threads"
-        self.cpp_info.components["jxl_threads"].libs = \
-            [self._lib_name("jxl_threads")]
-        if self.settings.os == "Linux":
-            self.cpp_info.components["jxl_threads"].system_libs = ["pthread"]
-
-        if not self.options.shared and tools.stdcpp_library(self):
-            self.cpp_info.components["jxl"].system_libs.append(
-                tools.stdcpp_library(self))
-            self.cpp_info.components["jxl_dec"].system_libs.append(
-                tools.stdcpp_library(self))
-            self.cpp_info.components["jxl_threads"].system_libs.append(
-                tools.stdcpp_library(self))
+        if self.options.with_threads:
+            self.cpp_info.components["jxl_threads"].set_property("pkg_config_name", "libjxl_threads")
+            self.cpp_info.components["jxl_threads"].libs = [self._lib_name("jxl_threads")]
+            if self.settings.os in ["Linux", "FreeBSD"]:
+                self.cpp_info.components["jxl_threads"].system_libs = ["pthread"]
+
+        if not self.options.shared and stdcpp_library(self):
+            for component in self.cpp_info.components.values():
+                component.system_libs.append(stdcpp_library(self))
+
+        # TODO: to remove in conan v2
+        self.cpp_info.components["jxl"].names["pkg_config"] = "libjxl"
+        self.cpp_info.components["jxl_dec"].names["pkg_config"] = "libjxl_dec"
+        if self.options.with_threads:
+            self.cpp_info.components["jxl_threads"].names["pkg_config"] = "libjxl_threads"
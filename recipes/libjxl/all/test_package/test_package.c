@@ -2,7 +2,9 @@
 #include <stdlib.h>
 
 #include "jxl/decode.h"
+#ifdef LIBJXL_WITH_THREADS
 #include "jxl/thread_parallel_runner.h"
+#endif
 
 static int ReadFile(const char filename[], uint8_t *data[], size_t *size)
 {
@@ -56,17 +58,21 @@ int main(int argc, char *argv[])
         return ret;
 
     JxlDecoder *dec = NULL;
+#ifdef LIBJXL_WITH_THREADS
     void *runner = NULL;
+#endif
 
     dec = JxlDecoderCreate(NULL);
     if (JxlDecoderSubscribeEvents(dec, JXL_DEC_BASIC_INFO) != JXL_DEC_SUCCESS)
         goto Exit;
 
+#ifdef LIBJXL_WITH_THREADS
     runner = JxlThreadParallelRunnerCreate(
         NULL, JxlThreadParallelRunnerDefaultNumWorkerThreads());
     if (JxlDecoderSetParallelRunner(dec, JxlThreadParallelRunner, runner)
             != JXL_DEC_SUCCESS)
         goto Exit;
+#endif
 
     if (JxlDecoderSetInput(dec, data, size) != JXL_DEC_SUCCESS)
         goto Exit;
@@ -84,7 +90,9 @@ int main(int argc, char *argv[])
 
 Exit:
     free(data);
+#ifdef LIBJXL_WITH_THREADS
     JxlThreadParallelRunnerDestroy(runner);
+#endif
     JxlDecoderDestroy(dec);
     return ret;
 }
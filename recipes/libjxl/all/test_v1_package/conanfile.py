@@ -0,0 +1,19 @@
+from conans import ConanFile, CMake, tools
+import os
+
+
+class TestPackageConan(ConanFile):
+    settings = "os", "arch", "compiler", "build_type"
+    generators = "cmake", "cmake_find_package_multi"
+
+    def build(self):
+        cmake = CMake(self)
+        cmake.definitions["LIBJXL_WITH_THREADS"] = self.options["libjxl"].with_threads
+        cmake.configure()
+        cmake.build()
+
+    def test(self):
+        if not tools.cross_building(self):
+            bin_path = os.path.join("bin", "test_package")
+            img_path = os.path.join(self.source_folder, os.pardir, "test_package", "test.jxl")
+            self.run(f"{bin_path} {img_path}", run_environment=True)
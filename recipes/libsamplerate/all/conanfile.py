@@ -25,15 +25,25 @@ class LibsamplerateConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "sinc_fast_converter": [True, False],
+        "sinc_medium_converter": [True, False],
+        "sinc_best_converter": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "sinc_fast_converter": True,
+        "sinc_medium_converter": True,
+        "sinc_best_converter": True,
     }
 
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if Version(self.version) < "0.2.2":
+            del self.options.sinc_fast_converter
+            del self.options.sinc_medium_converter
+            del self.options.sinc_best_converter
 
     def configure(self):
         if self.options.shared:
@@ -59,6 +69,11 @@ class LibsamplerateConan(ConanFile):
         tc.variables["LIBSAMPLERATE_EXAMPLES"] = False
         tc.variables["LIBSAMPLERATE_INSTALL"] = True
         tc.variables["BUILD_TESTING"] = False
+        if Version(self.version) >= "0.2.2":
+            # the large coefficient tables of the unused SINC converters can be left out
+            tc.variables["LIBSAMPLERATE_ENABLE_SINC_FAST_CONVERTER"] = self.options.sinc_fast_converter
+            tc.variables["LIBSAMPLERATE_ENABLE_SINC_MEDIUM_CONVERTER"] = self.options.sinc_medium_converter
+            tc.variables["LIBSAMPLERATE_ENABLE_SINC_BEST_CONVERTER"] = self.options.sinc_best_converter
         tc.generate()
 
     def _patch_sources(self):
@@ -1,6 +1,7 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir, save
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, replace_in_file, rmdir, save
 from conan.tools.microsoft import is_msvc, check_min_vs
 from conan.tools.scm import Version
 import os
@@ -21,10 +22,16 @@ class LibuvConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "with_io_uring": [None, True, False],
+        "threadpool_size": ["ANY"],
+        "max_threadpool_size": ["ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "with_io_uring": None,  # None means runtime detection (UV_USE_IO_URING env var)
+        "threadpool_size": 4,
+        "max_threadpool_size": 1024,
     }
 
     def export_sources(self):
@@ -33,6 +40,9 @@ class LibuvConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.os != "Linux" or Version(self.version) < "1.45.0":
+            # io_uring file operations have been introduced in libuv 1.45.0
+            del self.options.with_io_uring
 
     def configure(self):
         if self.options.shared:
@@ -46,6 +56,14 @@ class LibuvConan(ConanFile):
     def validate(self):
         if is_msvc(self):
             check_min_vs(self, "190")
+        for option in ["threadpool_size", "max_threadpool_size"]:
+            value = str(self.options.get_safe(option))
+            if not value.isdigit() or int(value) < 1:
+                raise ConanInvalidConfiguration(f"-o='{self.ref}:{option}' should be a positive integer")
+        if int(str(self.options.threadpool_size)) > int(str(self.options.max_threadpool_size)):
+            raise ConanInvalidConfiguration(
+                f"-o='{self.ref}:threadpool_size' can't be greater than -o='{self.ref}:max_threadpool_size'"
+            )
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -57,8 +75,29 @@ class LibuvConan(ConanFile):
             tc.variables["LIBUV_BUILD_SHARED"] = self.options.shared
         tc.generate()
 
-    def build(self):
+    def _patch_sources(self):
         apply_conandata_patches(self)
+        threadpool_c = os.path.join(self.source_folder, "src", "threadpool.c")
+        replace_in_file(self, threadpool_c,
+                        "#define MAX_THREADPOOL_SIZE 1024",
+                        f"#define MAX_THREADPOOL_SIZE {self.options.max_threadpool_size}")
+        replace_in_file(self, threadpool_c,
+                        "static uv_thread_t default_threads[4];",
+                        f"static uv_thread_t default_threads[{self.options.threadpool_size}];")
+        with_io_uring = str(self.options.get_safe("with_io_uring"))
+        if with_io_uring != "None":
+            # Bypass kernel version check and UV_USE_IO_URING env var
+            use_io_uring = 1 if with_io_uring == "True" else 0
+            replace_in_file(self, os.path.join(self.source_folder, "src", "unix", "linux.c"),
+                            "static int uv__use_io_uring(void) {",
+                            "static int uv__use_io_uring(void) {\n"
+                            f"  return {use_io_uring};\n"
+                            "}\n\n"
+                            "static int uv__use_io_uring_runtime(void) __attribute__((unused));\n"
+                            "static int uv__use_io_uring_runtime(void) {")
+
+    def build(self):
+        self._patch_sources()
         cmake = CMake(self)
         cmake.configure()
         cmake.build()
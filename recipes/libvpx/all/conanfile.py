@@ -29,10 +29,28 @@ class LibVPXConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "vp8_encoder": [True, False],
+        "vp8_decoder": [True, False],
+        "vp9_encoder": [True, False],
+        "vp9_decoder": [True, False],
+        "realtime_only": [True, False],
+        "runtime_cpu_detect": [None, True, False],
+        "multithread": [True, False],
+        "better_hw_compatibility": [True, False],
+        "small": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "vp8_encoder": True,
+        "vp8_decoder": True,
+        "vp9_encoder": True,
+        "vp9_decoder": True,
+        "realtime_only": False,
+        "runtime_cpu_detect": None,
+        "multithread": True,
+        "better_hw_compatibility": False,
+        "small": False,
     }
 
     _arch_options = ['mmx', 'sse', 'sse2', 'sse3', 'ssse3', 'sse4_1', 'avx', 'avx2', 'avx512']
@@ -71,6 +89,8 @@ class LibVPXConan(ConanFile):
             raise ConanInvalidConfiguration("M1 only supported since 1.10, please upgrade")
         if self.settings.os == "iOS" and (self.settings.os.sdk != "iphonesimulator" and self.settings.arch in ["x86_64", "x86"]):
             raise ConanInvalidConfiguration("iOS platform with x86/x86_64 architectures only supports 'iphonesimulator' SDK option")
+        if not any(self.options.get_safe(codec) for codec in ["vp8_encoder", "vp8_decoder", "vp9_encoder", "vp9_decoder"]):
+            raise ConanInvalidConfiguration(f"{self.ref} requires at least one of vp8_encoder, vp8_decoder, vp9_encoder or vp9_decoder")
 
     def build_requirements(self):
         self.tool_requires("yasm/1.3.0")
@@ -142,9 +162,29 @@ class LibVPXConan(ConanFile):
             "--disable-unit-tests",
             "--disable-tools",
             "--disable-docs",
-            "--enable-vp9-highbitdepth",
             "--as=yasm",
         ])
+        enable_disable = lambda opt, v: f"--{'enable' if v else 'disable'}-{opt}"
+        for codec in ["vp8", "vp9"]:
+            encoder = self.options.get_safe(f"{codec}_encoder")
+            decoder = self.options.get_safe(f"{codec}_decoder")
+            if encoder or decoder:
+                tc.configure_args.extend([
+                    enable_disable(f"{codec}-encoder", encoder),
+                    enable_disable(f"{codec}-decoder", decoder),
+                ])
+            else:
+                tc.configure_args.append(f"--disable-{codec}")
+        if self.options.vp9_encoder or self.options.vp9_decoder:
+            tc.configure_args.append("--enable-vp9-highbitdepth")
+        tc.configure_args.extend([
+            enable_disable("realtime-only", self.options.realtime_only),
+            enable_disable("multithread", self.options.multithread),
+            enable_disable("better-hw-compatibility", self.options.better_hw_compatibility),
+            enable_disable("small", self.options.small),
+        ])
+        if str(self.options.runtime_cpu_detect) != "None":
+            tc.configure_args.append(enable_disable("runtime-cpu-detect", self.options.runtime_cpu_detect))
         # Note for MSVC: release libs are always built, we just avoid keeping the release lib
         # Note2: Can't use --enable-debug_libs (to help install on Windows),
         #     the makefile's install step fails as it wants to install a library that doesn't exist.
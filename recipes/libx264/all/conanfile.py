@@ -25,11 +25,21 @@ class LibX264Conan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "bit_depth": [8, 10, "all"],
+        "chroma_format": ["400", "420", "422", "444", "all"],
+        "assembly": [True, False],
+        "with_threads": [True, False],
+        "with_lto": [True, False],
+        "with_opencl": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "bit_depth": "all",
+        "chroma_format": "all",
+        "assembly": True,
+        "with_threads": True,
+        "with_lto": False,
+        "with_opencl": True,
     }
 
     # otherwise build fails with: ln: failed to create symbolic link './Makefile' -> '../../../../../../../../../../../../../j/w/prod/buildsinglereference@2/.conan/data/libx264/cci.20220602/_/_/build/622692a7dbc145becf87f01b017e2a0d93cc644e/src/Makefile': File name too long
@@ -42,16 +52,23 @@ class LibX264Conan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.os not in ["Linux", "Macos", "Windows"]:
+            # configure only enables the dlopen'ed OpenCL lookahead on these
+            del self.options.with_opencl
 
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
         self.settings.rm_safe("compiler.libcxx")
         self.settings.rm_safe("compiler.cppstd")
+        if self.options.bit_depth == 10:
+            # OpenCL lookahead is only compiled for 8-bit encoding
+            self.options.rm_safe("with_opencl")
 
     @property
     def _with_nasm(self):
-        return self.settings.arch in ("x86", "x86_64")
+        # x86 assembly is written for nasm, configure rejects other assemblers
+        return self.options.assembly and self.settings.arch in ("x86", "x86_64")
 
     def layout(self):
         basic_layout(self, src_folder="src")
@@ -78,6 +95,7 @@ class LibX264Conan(ConanFile):
         extra_ldflags = []
         args = {
             "--bit-depth": self.options.bit_depth,
+            "--chroma-format": self.options.chroma_format,
             "--disable-cli": "",
             "--sbindir": None,          # Not understood by configure
             "--oldincludedir": None     # Not understood by configure
@@ -91,6 +109,14 @@ class LibX264Conan(ConanFile):
             args["--enable-pic"] = ""
         if self.settings.build_type == "Debug":
             args["--enable-debug"] = ""
+        if not self.options.assembly:
+            args["--disable-asm"] = ""
+        if not self.options.with_threads:
+            args["--disable-thread"] = ""
+        if self.options.with_lto:
+            args["--enable-lto"] = ""
+        if not self.options.get_safe("with_opencl"):
+            args["--disable-opencl"] = ""
 
         if is_apple_os(self) and self.settings.arch == "armv8":
             # bitstream-a.S:29:18: error: unknown token in expression
@@ -182,7 +208,9 @@ class LibX264Conan(ConanFile):
         if is_msvc(self) and self.options.shared:
             self.cpp_info.defines.append("X264_API_IMPORTS")
         if self.settings.os in ["FreeBSD", "Linux"]:
-            self.cpp_info.system_libs.extend(["dl", "pthread", "m"])
+            self.cpp_info.system_libs.extend(["dl", "m"])
+            if self.options.with_threads:
+                self.cpp_info.system_libs.append("pthread")
         elif self.settings.os == "Android":
             self.cpp_info.system_libs.extend(["dl", "m"])
 
@@ -1,12 +1,12 @@
 from conan import ConanFile
 from conan.tools.build import can_run
-from conan.tools.cmake import cmake_layout, CMake
+from conan.tools.cmake import cmake_layout, CMake, CMakeToolchain
 import os
 
 
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
-    generators = "CMakeDeps", "CMakeToolchain", "VirtualRunEnv"
+    generators = "CMakeDeps", "VirtualRunEnv"
     test_type = "explicit"
 
     def layout(self):
@@ -15,6 +15,13 @@ class TestPackageConan(ConanFile):
     def requirements(self):
         self.requires(self.tested_reference_str)
 
+    def generate(self):
+        tc = CMakeToolchain(self)
+        # x86 capabilities are only detected when the nasm-built assembly is compiled in
+        tc.variables["X264_EXPECT_ASM"] = bool(self.dependencies["libx264"].options.assembly) and \
+                                          self.settings.arch in ["x86", "x86_64"]
+        tc.generate()
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
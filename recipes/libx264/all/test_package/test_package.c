@@ -1,15 +1,34 @@
 #include <stdint.h>
 #include "x264.h"
 
+#include <stdio.h>
 #include <stdlib.h>
 
 int main()
 {
     x264_param_t preset;
     x264_t *encoder;
+    int i;
     x264_param_default_preset(&preset, "ultrafast", "zerolatency");
     preset.i_width = 640;
     preset.i_height = 480;
+
+    /* x264_param_default fills cpu with the x264_cpu_detect() result */
+    printf("x264 cpu capabilities:");
+    for (i = 0; x264_cpu_names[i].flags; i++) {
+        if ((preset.cpu & x264_cpu_names[i].flags) == x264_cpu_names[i].flags
+            && (!i || x264_cpu_names[i].flags != x264_cpu_names[i - 1].flags)) {
+            printf(" %s", x264_cpu_names[i].name);
+        }
+    }
+    printf("%s\n", preset.cpu ? "" : " none");
+#ifdef X264_EXPECT_ASM
+    if (!preset.cpu) {
+        fprintf(stderr, "x264 was built with assembly but no cpu capability was detected\n");
+        return EXIT_FAILURE;
+    }
+#endif
+
     encoder = x264_encoder_open(&preset);
     x264_encoder_close(encoder);
     return EXIT_SUCCESS;
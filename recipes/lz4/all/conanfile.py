@@ -1,4 +1,5 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir, save
 from conan.tools.microsoft import is_msvc
@@ -21,10 +22,20 @@ class LZ4Conan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "memory_usage": ["ANY"],
+        "heap_mode": [None, True, False],
+        "fast_dec_loop": [None, True, False],
+        "force_memory_access": [None, 0, 1, 2],
+        "build_programs": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "memory_usage": 14,
+        "heap_mode": None,  # None means upstream defaults (stack for LZ4, heap for LZ4HC)
+        "fast_dec_loop": None,  # None means upstream platform detection
+        "force_memory_access": None,  # None means upstream platform detection
+        "build_programs": False,
     }
 
     def export_sources(self):
@@ -43,16 +54,29 @@ class LZ4Conan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def validate(self):
+        memory_usage = str(self.options.memory_usage)
+        if not memory_usage.isdigit() or not 10 <= int(memory_usage) <= 20:
+            raise ConanInvalidConfiguration(f"-o='{self.ref}:memory_usage' should be an integer between 10 and 20")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version],
             destination=self.source_folder, strip_root=True)
 
     def generate(self):
         tc = CMakeToolchain(self)
-        tc.variables["LZ4_BUILD_CLI"] = False
+        tc.variables["LZ4_BUILD_CLI"] = self.options.build_programs
         tc.variables["LZ4_BUILD_LEGACY_LZ4C"] = False
         tc.variables["LZ4_BUNDLED_MODE"] = False
         tc.variables["LZ4_POSITION_INDEPENDENT_LIB"] = self.options.get_safe("fPIC", True)
+        tc.preprocessor_definitions["LZ4_MEMORY_USAGE"] = str(self.options.memory_usage)
+        if str(self.options.heap_mode) != "None":
+            tc.preprocessor_definitions["LZ4_HEAPMODE"] = 1 if self.options.heap_mode else 0
+            tc.preprocessor_definitions["LZ4HC_HEAPMODE"] = 1 if self.options.heap_mode else 0
+        if str(self.options.fast_dec_loop) != "None":
+            tc.preprocessor_definitions["LZ4_FAST_DEC_LOOP"] = 1 if self.options.fast_dec_loop else 0
+        if str(self.options.force_memory_access) != "None":
+            tc.preprocessor_definitions["LZ4_FORCE_MEMORY_ACCESS"] = str(self.options.force_memory_access)
         # Generate a relocatable shared lib on Macos
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0042"] = "NEW"
         # Honor BUILD_SHARED_LIBS (see https://github.com/conan-io/conan/issues/11840)
@@ -115,8 +139,13 @@ class LZ4Conan(ConanFile):
         self.cpp_info.libs = ["lz4"]
         if is_msvc(self) and self.options.shared:
             self.cpp_info.defines.append("LZ4_DLL_IMPORT=1")
+        # LZ4_MEMORY_USAGE drives the size of LZ4_stream_t in lz4.h
+        if self.options.memory_usage != "14":
+            self.cpp_info.defines.append(f"LZ4_MEMORY_USAGE={self.options.memory_usage}")
 
         # TODO: to remove in conan v2 once legacy generators removed
         self.cpp_info.build_modules["cmake_find_package"] = [self._module_file_rel_path]
         self.cpp_info.build_modules["cmake_find_package_multi"] = [self._module_file_rel_path]
         self.cpp_info.names["pkg_config"] = "liblz4"
+        if self.options.build_programs:
+            self.env_info.PATH.append(os.path.join(self.package_folder, "bin"))
@@ -28,6 +28,11 @@ class MimallocConan(ConanFile):
         "override": [True, False],
         "inject": [True, False],
         "single_object": [True, False],
+        "padding": [None, True, False],
+        "debug_full": [True, False],
+        "reserve_os_memory": [None, "ANY"],
+        "allow_large_os_pages": [None, True, False],
+        "arena_eager_commit": [None, 0, 1, 2],
     }
     default_options = {
         "shared": False,
@@ -36,14 +41,30 @@ class MimallocConan(ConanFile):
         "override": False,
         "inject": False,
         "single_object": False,
+        "padding": None,  # None means upstream default
+        "debug_full": False,
+        # None values keep upstream defaults of mi_option_*, which can still be changed at runtime via MIMALLOC_* env vars
+        "reserve_os_memory": None,  # in KiB
+        "allow_large_os_pages": None,
+        "arena_eager_commit": None,
     }
 
     def export_sources(self):
         export_conandata_patches(self)
 
+    @property
+    def _has_build_time_option_defaults(self):
+        # MI_DEFAULT_* macros have been introduced in 1.8.2 and 2.1.2
+        version = Version(self.version)
+        return version >= "2.1.2" or ("1.8.2" <= version < "2.0.0")
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if not self._has_build_time_option_defaults:
+            del self.options.reserve_os_memory
+            del self.options.allow_large_os_pages
+            del self.options.arena_eager_commit
 
         # single_object and inject are options
         # only when overriding on Unix-like platforms:
@@ -95,6 +116,10 @@ class MimallocConan(ConanFile):
            self.options.get_safe("inject"):
             raise ConanInvalidConfiguration("Single object is incompatible with library injection")
 
+        reserve_os_memory = self.options.get_safe("reserve_os_memory")
+        if reserve_os_memory and not str(reserve_os_memory).isdigit():
+            raise ConanInvalidConfiguration(f"-o='{self.ref}:reserve_os_memory' should be a positive integer (in KiB)")
+
     def build_requirements(self):
         self.tool_requires("cmake/[>=3.18 <4]")
 
@@ -110,6 +135,15 @@ class MimallocConan(ConanFile):
         tc.variables["MI_OVERRIDE"] = "ON" if self.options.override else "OFF"
         tc.variables["MI_SECURE"] = "ON" if self.options.secure else "OFF"
         tc.variables["MI_WIN_REDIRECT"] = "OFF"
+        if str(self.options.padding) != "None":
+            tc.variables["MI_PADDING"] = "ON" if self.options.padding else "OFF"
+        tc.variables["MI_DEBUG_FULL"] = "ON" if self.options.debug_full else "OFF"
+        if self.options.get_safe("reserve_os_memory"):
+            tc.preprocessor_definitions["MI_DEFAULT_RESERVE_OS_MEMORY"] = str(self.options.reserve_os_memory)
+        if str(self.options.get_safe("allow_large_os_pages")) != "None":
+            tc.preprocessor_definitions["MI_DEFAULT_ALLOW_LARGE_OS_PAGES"] = 1 if self.options.allow_large_os_pages else 0
+        if str(self.options.get_safe("arena_eager_commit")) != "None":
+            tc.preprocessor_definitions["MI_DEFAULT_ARENA_EAGER_COMMIT"] = str(self.options.arena_eager_commit)
         if Version(self.version) >= "1.7.0":
             tc.variables["MI_INSTALL_TOPLEVEL"] = "ON"
         tc.generate()
@@ -104,7 +104,9 @@ class OpenCVConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         # global options
-        "parallel": [False, "tbb", "openmp"],
+        "parallel": [False, "tbb", "openmp", "pthreads"],
+        "with_lapack": [True, False],
+        "with_va": [True, False],
         "with_ipp": [False, "intel-ipp", "opencv-icv"],
         "with_eigen": [True, False],
         "neon": [True, False],
@@ -122,6 +124,7 @@ class OpenCVConan(ConanFile):
         "with_flatbuffers": [True, False],
         "with_protobuf": [True, False],
         "with_vulkan": [True, False],
+        "with_openvino": [True, False],
         "dnn_cuda": [True, False],
         # highgui module options
         "with_gtk": [True, False],
@@ -164,6 +167,8 @@ class OpenCVConan(ConanFile):
         "fPIC": True,
         # global options
         "parallel": False,
+        "with_lapack": False,
+        "with_va": False,
         "with_ipp": False,
         "with_eigen": True,
         "neon": True,
@@ -181,6 +186,7 @@ class OpenCVConan(ConanFile):
         "with_flatbuffers": True,
         "with_protobuf": True,
         "with_vulkan": False,
+        "with_openvino": False,
         "dnn_cuda": False,
         # highgui module options
         "with_gtk": False,
@@ -292,6 +298,11 @@ class OpenCVConan(ConanFile):
     def _has_with_avif_option(self):
         return Version(self.version) >= "4.8.0"
 
+    @property
+    def _has_with_openvino_option(self):
+        # Older releases only know the legacy Inference Engine API, removed from openvino
+        return Version(self.version) >= "4.6.0"
+
     @property
     def _has_with_flatbuffers_option(self):
         return Version(self.version) >= "4.8.0"
@@ -305,11 +316,15 @@ class OpenCVConan(ConanFile):
         if self.settings.os != "Linux":
             del self.options.with_gtk
             del self.options.with_v4l
+            del self.options.with_va
         if self.settings.os in ["iOS", "Android"]:
             del self.options.with_opencl
         if self.settings.os != "Windows":
             del self.options.with_msmf
             del self.options.with_msmf_dxva
+        if self.settings.os != "Windows" or self._is_mingw:
+            # Upstream builds its pthreads-based parallel_for backend by default where available
+            self.options.parallel = "pthreads"
 
         if self._has_with_ffmpeg_option:
             # Following the packager choice, ffmpeg is enabled by default when
@@ -343,6 +358,8 @@ class OpenCVConan(ConanFile):
             del self.options.with_wayland
         if not self._has_with_avif_option:
             del self.options.with_avif
+        if not self._has_with_openvino_option:
+            del self.options.with_openvino
         if not self._has_with_flatbuffers_option:
             del self.options.with_flatbuffers
 
@@ -409,6 +426,12 @@ class OpenCVConan(ConanFile):
         def parallel():
             return ["onetbb::onetbb"] if self.options.parallel == "tbb" else []
 
+        def lapack():
+            return ["openblas::openblas"] if self.options.with_lapack else []
+
+        def openvino():
+            return ["openvino::Runtime"] if self.options.get_safe("with_openvino") else []
+
         def protobuf():
             return ["protobuf::protobuf"] if self.options.get_safe("with_protobuf") else []
 
@@ -421,6 +444,9 @@ class OpenCVConan(ConanFile):
         def tesseract():
             return ["tesseract::tesseract"] if self.options.get_safe("with_tesseract") else []
 
+        def va():
+            return ["vaapi::vaapi"] if self.options.get_safe("with_va") else []
+
         def vulkan():
             return ["vulkan-headers::vulkan-headers"] if self.options.get_safe("with_vulkan") else []
 
@@ -491,7 +517,7 @@ class OpenCVConan(ConanFile):
             "core": {
                 "is_built": True,
                 "no_option": True,
-                "requires": ["zlib::zlib"] + parallel() + eigen() + ipp(),
+                "requires": ["zlib::zlib"] + parallel() + lapack() + eigen() + ipp() + va(),
                 "system_libs": [
                     (self.settings.os == "Android", ["dl", "m", "log"]),
                     (self.settings.os == "FreeBSD", ["m", "pthread"]),
@@ -504,7 +530,7 @@ class OpenCVConan(ConanFile):
             "dnn": {
                 "is_built": self.options.dnn,
                 "mandatory_options": ["imgproc"],
-                "requires": ["opencv_core", "opencv_imgproc"] + protobuf() + vulkan() + ipp(),
+                "requires": ["opencv_core", "opencv_imgproc"] + protobuf() + vulkan() + openvino() + ipp(),
             },
             "features2d": {
                 "is_built": self.options.features2d,
@@ -518,7 +544,7 @@ class OpenCVConan(ConanFile):
             "gapi": {
                 "is_built": self.options.gapi,
                 "mandatory_options": ["imgproc"],
-                "requires": ["opencv_imgproc", "ade::ade"],
+                "requires": ["opencv_imgproc", "ade::ade"] + openvino(),
                 "system_libs": [
                     (self.settings.os == "Windows", ["ws2_32", "wsock32"]),
                 ],
@@ -578,7 +604,7 @@ class OpenCVConan(ConanFile):
             "videoio": {
                 "is_built": self.options.videoio,
                 "mandatory_options": ["imgcodecs", "imgproc"],
-                "requires": ["opencv_imgcodecs", "opencv_imgproc"] + ffmpeg() + ipp(),
+                "requires": ["opencv_imgcodecs", "opencv_imgproc"] + ffmpeg() + ipp() + va(),
                 "system_libs": [
                     (self.settings.os == "Android" and int(str(self.settings.os.api_level)) > 20, ["mediandk"]),
                 ],
@@ -1043,6 +1069,7 @@ class OpenCVConan(ConanFile):
             self.options.rm_safe("with_flatbuffers")
             self.options.rm_safe("with_protobuf")
             self.options.rm_safe("with_vulkan")
+            self.options.rm_safe("with_openvino")
         if not self.options.highgui:
             self.options.rm_safe("with_gtk")
             self.options.rm_safe("with_wayland")
@@ -1094,6 +1121,11 @@ class OpenCVConan(ConanFile):
             self.requires("eigen/3.4.0")
         if self.options.parallel == "tbb":
             self.requires("onetbb/2021.10.0")
+        if self.options.with_lapack:
+            self.requires("openblas/0.3.27")
+        if self.options.get_safe("with_va"):
+            # same provider as ffmpeg's with_vaapi, so that both link the same libva
+            self.requires("vaapi/system")
         if self.options.with_ipp == "intel-ipp":
             self.requires("intel-ipp/2020")
         # dnn module dependencies
@@ -1102,6 +1134,8 @@ class OpenCVConan(ConanFile):
             self.requires("protobuf/3.21.12", transitive_libs=True)
         if self.options.get_safe("with_vulkan"):
             self.requires("vulkan-headers/1.3.268.0")
+        if self.options.get_safe("with_openvino"):
+            self.requires("openvino/2023.3.0")
         # gapi module dependencies
         if self.options.gapi:
             self.requires("ade/0.1.2d")
@@ -1208,6 +1242,10 @@ class OpenCVConan(ConanFile):
         if self.options.with_ipp == "opencv-icv" and \
            not (self.settings.arch in ["x86", "x86_64"] and self.settings.os in ["Linux", "Macos", "Windows"]):
             raise ConanInvalidConfiguration(f"opencv-icv is not available for {self.settings.os}/{self.settings.arch}")
+        if self.options.parallel == "pthreads" and self.settings.os == "Windows" and not self._is_mingw:
+            raise ConanInvalidConfiguration("parallel=pthreads is not available with MSVC-like compilers")
+        if self.options.with_lapack and not self.dependencies["openblas"].options.build_lapack:
+            raise ConanInvalidConfiguration("with_lapack requires openblas/*:build_lapack=True (cblas.h and lapacke.h)")
         if self.options.viz:
             raise ConanInvalidConfiguration(
                 "viz module can't be enabled yet. It requires VTK which is not available in conan-center."
@@ -1305,6 +1343,25 @@ class OpenCVConan(ConanFile):
                                       'if(TARGET "${Protobuf_LIBRARIES}")',
                                       'if(FALSE)  # patch: disable if(TARGET "${Protobuf_LIBRARIES}")')
 
+        ## Use OpenBLAS from conan as LAPACK backend instead of searching it in system paths
+        if self.options.with_lapack:
+            save(self, os.path.join(self.source_folder, "cmake", "OpenCVFindOpenBLAS.cmake"), textwrap.dedent("""\
+                find_package(OpenBLAS REQUIRED CONFIG)
+                set(OpenBLAS_FOUND TRUE)
+                set(OpenBLAS_INCLUDE_DIR ${OpenBLAS_INCLUDE_DIRS})
+                set(OpenBLAS_LIB OpenBLAS::OpenBLAS)
+                set(OpenBLAS_LIBRARIES OpenBLAS::OpenBLAS)
+            """))
+
+        ## Use VA-API from conan instead of searching it in system paths
+        if self.options.get_safe("with_va"):
+            save(self, os.path.join(self.source_folder, "cmake", "OpenCVFindVA.cmake"), textwrap.dedent("""\
+                find_package(vaapi REQUIRED CONFIG)
+                set(HAVE_VA TRUE)
+                set(VA_INCLUDE_DIR ${vaapi_INCLUDE_DIRS})
+                set(VA_LIBRARIES vaapi::vaapi)
+            """))
+
         # Patches in opencv_contrib
         # -------------------------
 
@@ -1420,6 +1477,7 @@ class OpenCVConan(ConanFile):
         tc.variables["WITH_OPENGL"] = False
         tc.variables["WITH_TBB"] = self.options.parallel == "tbb"
         tc.variables["WITH_OPENMP"] = self.options.parallel == "openmp"
+        tc.variables["WITH_PTHREADS_PF"] = self.options.parallel == "pthreads"
         tc.variables["WITH_OPENNI"] = False
         tc.variables["WITH_OPENNI2"] = False
         tc.variables["WITH_OPENVX"] = False
@@ -1429,15 +1487,19 @@ class OpenCVConan(ConanFile):
         tc.variables["WITH_QT"] = self.options.get_safe("with_qt", False)
         tc.variables["WITH_QUIRC"] = self.options.get_safe("with_quirc", False)
         tc.variables["WITH_V4L"] = self.options.get_safe("with_v4l", False)
-        tc.variables["WITH_VA"] = False
-        tc.variables["WITH_VA_INTEL"] = False
+        tc.variables["WITH_VA"] = self.options.get_safe("with_va", False)
+        # VA-API/OpenCL surface sharing
+        tc.variables["WITH_VA_INTEL"] = self.options.get_safe("with_va", False) and self.options.get_safe("with_opencl", False)
         tc.variables["WITH_VTK"] = self.options.viz
         tc.variables["WITH_VULKAN"] = self.options.get_safe("with_vulkan", False)
         if self.options.get_safe("with_vulkan"):
             tc.variables["VULKAN_INCLUDE_DIRS"] = os.path.join(self.dependencies["vulkan-headers"].package_folder, "include").replace("\\", "/")
         tc.variables["WITH_XIMEA"] = False
         tc.variables["WITH_XINE"] = False
-        tc.variables["WITH_LAPACK"] = False
+        tc.variables["WITH_LAPACK"] = self.options.with_lapack
+        if self.options.with_lapack:
+            # Do not let a system MKL take precedence over openblas
+            tc.variables["OPENCV_LAPACK_DISABLE_MKL"] = True
 
         tc.variables["WITH_GTK"] = self.options.get_safe("with_gtk", False)
         tc.variables["WITH_GTK_2_X"] = self._is_gtk_version2
@@ -1470,7 +1532,7 @@ class OpenCVConan(ConanFile):
         tc.variables["OPENCV_DNN_CUDA"] = self.options.get_safe("dnn_cuda", False)
 
         if Version(self.version) >= "4.6.0":
-            tc.variables["WITH_OPENVINO"] = False
+            tc.variables["WITH_OPENVINO"] = self.options.get_safe("with_openvino", False)
             tc.variables["WITH_TIMVX"] = False
         else:
             tc.variables["WITH_INF_ENGINE"] = False
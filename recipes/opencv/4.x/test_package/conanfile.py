@@ -42,6 +42,7 @@ class TestPackageConan(ConanFile):
                 tc.variables[cmake_option] = self.dependencies["opencv"].options.videoio and self.dependencies["opencv"].options.with_ffmpeg
             else:
                 tc.variables[cmake_option] = self.dependencies["opencv"].options.get_safe(module, False)
+        tc.variables["OPENCV_DNN_WITH_OPENVINO"] = self.dependencies["opencv"].options.get_safe("with_openvino", False)
         tc.generate()
 
     def build(self):
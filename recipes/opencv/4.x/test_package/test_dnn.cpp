@@ -1,6 +1,14 @@
 #include <opencv2/dnn/dnn.hpp>
 
+#include <iostream>
+
 int main() {
     auto backends = cv::dnn::getAvailableBackends();
+#ifdef OPENCV_DNN_WITH_OPENVINO
+    if (cv::dnn::getAvailableTargets(cv::dnn::DNN_BACKEND_INFERENCE_ENGINE).empty()) {
+        std::cerr << "OpenVINO backend is not registered" << std::endl;
+        return 1;
+    }
+#endif
     return 0;
 }
@@ -2,6 +2,7 @@ from conan import ConanFile
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.files import apply_conandata_patches, export_conandata_patches, copy, get, rmdir, replace_in_file
+from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 import os
 
@@ -21,10 +22,14 @@ class OpenEXRConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "with_threads": [True, False],
+        "with_f16c": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "with_threads": True,
+        "with_f16c": False,
     }
 
     @property
@@ -41,6 +46,8 @@ class OpenEXRConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.arch not in ["x86", "x86_64"] or is_msvc(self):
+            del self.options.with_f16c
 
     def configure(self):
         if self.options.shared:
@@ -69,6 +76,11 @@ class OpenEXRConan(ConanFile):
         tc.variables["BUILD_TESTING"] = False
         tc.variables["BUILD_WEBSITE"] = False
         tc.variables["DOCS"] = False
+        tc.variables["OPENEXR_ENABLE_THREADING"] = self.options.with_threads
+        if self.options.get_safe("with_f16c"):
+            # Imath half conversions are inlined and use F16C instructions when available
+            tc.extra_cflags.append("-mf16c")
+            tc.extra_cxxflags.append("-mf16c")
         tc.generate()
         cd = CMakeDeps(self)
         cd.generate()
@@ -148,7 +160,9 @@ class OpenEXRConan(ConanFile):
             self._conan_comp("IlmThreadConfig"), self._conan_comp("Iex"),
         ]
         if self.settings.os in ["Linux", "FreeBSD"]:
-            IlmThread.system_libs = ["pthread", "m"]
+            IlmThread.system_libs = ["m"]
+            if self.options.with_threads:
+                IlmThread.system_libs.append("pthread")
 
         # OpenEXR::OpenEXRCore
         OpenEXRCore = self._add_component("OpenEXRCore")
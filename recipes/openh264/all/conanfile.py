@@ -25,10 +25,12 @@ class OpenH264Conan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "assembly": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "assembly": True,
     }
 
     @property
@@ -53,8 +55,12 @@ class OpenH264Conan(ConanFile):
     def layout(self):
         basic_layout(self, src_folder="src")
 
+    @property
+    def _with_nasm(self):
+        return self.options.assembly and self.settings.arch in ("x86", "x86_64")
+
     def build_requirements(self):
-        if self.settings.arch in ("x86", "x86_64"):
+        if self._with_nasm:
             self.tool_requires("nasm/2.15.05")
         if self._settings_build.os == "Windows":
             self.win_bash = True
@@ -119,6 +125,8 @@ class OpenH264Conan(ConanFile):
             f"ARCH={self._make_arch}",
             f"PREFIX={prefix}"
         ]
+        if not self.options.assembly:
+            args.append("USE_ASM=No")
 
         if is_msvc(self) or self._is_clang_cl:
             args.append("OS=msvc")
@@ -260,6 +260,9 @@ class ProtobufConan(ConanFile):
         if self.settings.os == "Windows":
             if self.options.shared:
                 self.cpp_info.components["libprotobuf"].defines = ["PROTOBUF_USE_DLLS"]
+        if not self.options.with_rtti:
+            # PROTOBUF_RTTI in port_def.inc drives inline code of public headers
+            self.cpp_info.components["libprotobuf"].defines.append("GOOGLE_PROTOBUF_NO_RTTI")
 
         # libprotoc
         if self.settings.os != "tvOS":
@@ -282,6 +285,8 @@ class ProtobufConan(ConanFile):
             if self.settings.os == "Windows":
                 if self.options.shared:
                     self.cpp_info.components["libprotobuf-lite"].defines = ["PROTOBUF_USE_DLLS"]
+            if not self.options.with_rtti:
+                self.cpp_info.components["libprotobuf-lite"].defines.append("GOOGLE_PROTOBUF_NO_RTTI")
             if self.settings.os == "Android":
                 self.cpp_info.components["libprotobuf-lite"].system_libs.append("log")
             if self._protobuf_release >= "22.0":
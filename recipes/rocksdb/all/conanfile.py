@@ -33,6 +33,9 @@ class RocksDBConan(ConanFile):
         "with_zstd": [True, False],
         "with_tbb": [True, False],
         "with_jemalloc": [True, False],
+        "with_liburing": [True, False],
+        "with_numa": [True, False],
+        "with_folly": [True, False],
         "enable_sse": [False, "sse42", "avx2"],
         "use_rtti": [True, False],
     }
@@ -47,6 +50,9 @@ class RocksDBConan(ConanFile):
         "with_gflags": False,
         "with_tbb": False,
         "with_jemalloc": False,
+        "with_liburing": False,
+        "with_numa": False,
+        "with_folly": False,
         "enable_sse": False,
         "use_rtti": False,
     }
@@ -73,6 +79,12 @@ class RocksDBConan(ConanFile):
             del self.options.fPIC
         if self.settings.arch != "x86_64":
             del self.options.with_tbb
+        if self.settings.os != "Linux":
+            del self.options.with_liburing
+            del self.options.with_numa
+        if Version(self.version) >= "7.0.0":
+            # folly::DistributedMutex is only vendored in third-party/folly before RocksDB 7
+            del self.options.with_folly
         if self.settings.build_type == "Debug":
             self.options.use_rtti = True  # Rtti are used in asserts for debug mode...
 
@@ -98,6 +110,10 @@ class RocksDBConan(ConanFile):
             self.requires("onetbb/2021.10.0")
         if self.options.with_jemalloc:
             self.requires("jemalloc/5.3.0")
+        if self.options.get_safe("with_liburing"):
+            self.requires("liburing/2.6")
+        if self.options.get_safe("with_numa"):
+            self.requires("libnuma/2.0.16")
 
     def validate(self):
         if self.settings.compiler.get_safe("cppstd"):
@@ -130,7 +146,8 @@ class RocksDBConan(ConanFile):
         tc.variables["WITH_TOOLS"] = False
         tc.variables["WITH_CORE_TOOLS"] = False
         tc.variables["WITH_BENCHMARK_TOOLS"] = False
-        tc.variables["WITH_FOLLY_DISTRIBUTED_MUTEX"] = False
+        if "with_folly" in self.options:
+            tc.variables["WITH_FOLLY_DISTRIBUTED_MUTEX"] = self.options.with_folly
         if is_msvc(self):
             tc.variables["WITH_MD_LIBRARY"] = not is_msvc_static_runtime(self)
         tc.variables["ROCKSDB_INSTALL_ON_WINDOWS"] = self.settings.os == "Windows"
@@ -155,8 +172,8 @@ class RocksDBConan(ConanFile):
         elif self.options.enable_sse == "avx2":
             tc.variables["PORTABLE"] = False
             tc.variables["FORCE_SSE42"] = False
-        # not available yet in CCI
-        tc.variables["WITH_NUMA"] = False
+        tc.variables["WITH_LIBURING"] = self.options.get_safe("with_liburing", False)
+        tc.variables["WITH_NUMA"] = self.options.get_safe("with_numa", False)
         tc.generate()
 
         deps = CMakeDeps(self)
@@ -165,6 +182,12 @@ class RocksDBConan(ConanFile):
             deps.set_property("jemalloc", "cmake_target_name", "JeMalloc::JeMalloc")
         if self.options.with_zstd:
             deps.set_property("zstd", "cmake_target_name", "zstd::zstd")
+        if self.options.get_safe("with_liburing"):
+            deps.set_property("liburing", "cmake_file_name", "uring")
+            deps.set_property("liburing", "cmake_target_name", "uring::uring")
+        if self.options.get_safe("with_numa"):
+            deps.set_property("libnuma", "cmake_file_name", "NUMA")
+            deps.set_property("libnuma", "cmake_target_name", "NUMA::NUMA")
         deps.generate()
 
     def build(self):
@@ -233,3 +256,7 @@ class RocksDBConan(ConanFile):
             self.cpp_info.components["librocksdb"].requires.append("onetbb::onetbb")
         if self.options.with_jemalloc:
             self.cpp_info.components["librocksdb"].requires.append("jemalloc::jemalloc")
+        if self.options.get_safe("with_liburing"):
+            self.cpp_info.components["librocksdb"].requires.append("liburing::liburing")
+        if self.options.get_safe("with_numa"):
+            self.cpp_info.components["librocksdb"].requires.append("libnuma::libnuma")
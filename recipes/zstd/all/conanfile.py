@@ -1,6 +1,8 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.files import apply_conandata_patches, collect_libs, copy, export_conandata_patches, get, replace_in_file, rmdir, rm
+from conan.tools.scm import Version
 import glob
 import os
 
@@ -21,12 +23,24 @@ class ZstdConan(ConanFile):
         "fPIC": [True, False],
         "threading": [True, False],
         "build_programs": [True, False],
+        "assembly": [True, False],
+        "legacy_support": [True, False],
+        "build_dictbuilder": [True, False],
+        "build_deprecated": [True, False],
+        "decompress_only": [True, False],
+        "compress_only": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "threading": True,
         "build_programs": True,
+        "assembly": True,
+        "legacy_support": True,
+        "build_dictbuilder": True,
+        "build_deprecated": False,
+        "decompress_only": False,
+        "compress_only": False,
     }
 
     def export_sources(self):
@@ -35,16 +49,39 @@ class ZstdConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if Version(self.version) < "1.5.1" or self.settings.arch != "x86_64":
+            # Huffman decoder assembly is only available for x86_64 since 1.5.1
+            del self.options.assembly
+        if Version(self.version) < "1.5.6":
+            del self.options.build_dictbuilder
+            del self.options.build_deprecated
+            del self.options.decompress_only
+            del self.options.compress_only
 
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if self.options.get_safe("decompress_only"):
+            # dictBuilder depends on compression module
+            self.options.rm_safe("build_dictbuilder")
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
 
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def validate(self):
+        if self.options.get_safe("decompress_only") and self.options.get_safe("compress_only"):
+            raise ConanInvalidConfiguration("decompress_only and compress_only are mutually exclusive")
+        if self.options.get_safe("build_deprecated") and (self.options.get_safe("decompress_only") or self.options.get_safe("compress_only")):
+            raise ConanInvalidConfiguration("build_deprecated requires both compression and decompression modules")
+        if self.options.build_programs and (self.options.get_safe("decompress_only") or
+                                            self.options.get_safe("compress_only") or
+                                            not self.options.get_safe("build_dictbuilder", True)):
+            raise ConanInvalidConfiguration(
+                "build_programs requires the full library, set -o='zstd/*:build_programs=False' for a lean build"
+            )
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
 
@@ -54,6 +91,14 @@ class ZstdConan(ConanFile):
         tc.variables["ZSTD_BUILD_STATIC"] = not self.options.shared or self.options.build_programs
         tc.variables["ZSTD_BUILD_SHARED"] = self.options.shared
         tc.variables["ZSTD_MULTITHREAD_SUPPORT"] = self.options.threading
+        tc.variables["ZSTD_LEGACY_SUPPORT"] = self.options.legacy_support
+        if Version(self.version) >= "1.5.6":
+            tc.variables["ZSTD_BUILD_COMPRESSION"] = not self.options.decompress_only
+            tc.variables["ZSTD_BUILD_DECOMPRESSION"] = not self.options.compress_only
+            tc.variables["ZSTD_BUILD_DICTBUILDER"] = self.options.get_safe("build_dictbuilder", False)
+            tc.variables["ZSTD_BUILD_DEPRECATED"] = self.options.build_deprecated
+        if not self.options.get_safe("assembly", True):
+            tc.preprocessor_definitions["ZSTD_DISABLE_ASM"] = 1
         tc.generate()
 
     def _patch_sources(self):
@@ -1,12 +1,12 @@
 from conan import ConanFile
 from conan.tools.build import can_run
-from conan.tools.cmake import CMake, cmake_layout
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 import os
 
 
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
-    generators = "CMakeToolchain", "CMakeDeps", "VirtualRunEnv"
+    generators = "CMakeDeps", "VirtualRunEnv"
     test_type = "explicit"
 
     def layout(self):
@@ -15,6 +15,13 @@ class TestPackageConan(ConanFile):
     def requirements(self):
         self.requires(self.tested_reference_str, run=True)
 
+    def generate(self):
+        tc = CMakeToolchain(self)
+        zstd_options = self.dependencies["zstd"].options
+        tc.variables["ZSTD_WITH_COMPRESSION"] = not zstd_options.get_safe("decompress_only", False)
+        tc.variables["ZSTD_WITH_DECOMPRESSION"] = not zstd_options.get_safe("compress_only", False)
+        tc.generate()
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
@@ -4,9 +4,21 @@
 #include <zstd.h>
 
 int main() {
+    printf("zstd version: %s\n", ZSTD_versionString());
+
+#ifdef ZSTD_WITH_COMPRESSION
     const char* originalData = "Sample text";
     size_t compressedSize = ZSTD_compressBound(strlen(originalData) + 1);
     printf("%zu\n", compressedSize);
+#endif
+
+#ifdef ZSTD_WITH_DECOMPRESSION
+    ZSTD_DCtx* dctx = ZSTD_createDCtx();
+    if (dctx == NULL) {
+        return EXIT_FAILURE;
+    }
+    ZSTD_freeDCtx(dctx);
+#endif
 
     return 0;
 }